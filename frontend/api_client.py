@@ -2,14 +2,30 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
 import os
+import random
+import time
+from collections.abc import Iterator
 from typing import Any
 
-import requests
+import httpx
+
+try:  # orjson parses response bodies ~5x faster than stdlib json
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+_DEFAULT_HEADERS = {"Accept": "application/json", "Content-Type": "application/json"}
 
 
 class ClaimAPIClient:
-    """Wrapper around ``requests`` for the claim-processing backend.
+    """Wrapper around ``httpx`` for the claim-processing backend.
+
+    Uses a persistent ``httpx.Client`` with HTTP/2 enabled, so back-to-back
+    calls reuse pooled keep-alive connections and benefit from header
+    compression.
 
     Parameters
     ----------
@@ -20,6 +36,12 @@ class ClaimAPIClient:
         Request timeout in seconds.
     max_retries:
         Number of retry attempts on connection / 5xx errors.
+    base_delay:
+        Initial delay (seconds) before the first retry; doubles each attempt.
+    max_delay:
+        Upper bound (seconds) on the backoff delay.
+    jitter:
+        Fractional random jitter added to each delay to avoid thundering herds.
     """
 
     def __init__(
@@ -27,10 +49,26 @@ class ClaimAPIClient:
         base_url: str | None = None,
         timeout: int = 120,
         max_retries: int = 2,
+        base_delay: float = 1.0,
+        max_delay: float = 30.0,
+        jitter: float = 0.5,
     ) -> None:
         self.base_url = (base_url or os.getenv("API_BASE_URL", "http://localhost:8000")).rstrip("/")
         self.timeout = timeout
         self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+
+        # Persistent client → connection pooling + HTTP/2 multiplexing, so
+        # back-to-back calls skip the TCP/TLS handshake entirely.
+        self._client = httpx.Client(
+            base_url=self.base_url,
+            timeout=timeout,
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=5),
+            headers=_DEFAULT_HEADERS,
+        )
 
     # -----------------------------------------------------------------
     # Public helpers
@@ -48,6 +86,62 @@ class ClaimAPIClient:
         """``POST /api/v1/claims/process`` — submit a claim for processing."""
         return self._post("/api/v1/claims/process", json=claim_data)
 
+    def process_claim_stream(self, claim_data: dict[str, Any]) -> Iterator[dict[str, Any]]:
+        """``POST /api/v1/claims/process/stream`` — yield NDJSON progress events.
+
+        Yields each parsed event dict as it arrives (``status`` events while
+        the pipeline runs, then ``decision``).  Raises :class:`APIError` if
+        the backend reports an ``error`` event or a non-2xx status.
+        """
+        timeout = httpx.Timeout(self.timeout, read=None)  # no read timeout mid-stream
+        with self._client.stream(
+            "POST", "/api/v1/claims/process/stream", json=claim_data, timeout=timeout
+        ) as resp:
+            if resp.status_code >= 400:
+                resp.read()
+                error_body = _safe_json(resp)
+                raise APIError(
+                    f"HTTP {resp.status_code}: {error_body.get('detail', resp.text)}",
+                    status_code=resp.status_code,
+                )
+            for line in resp.iter_lines():
+                if not line.strip():
+                    continue
+                event = json.loads(line)
+                if event.get("event") == "error":
+                    raise APIError(event.get("detail", "Pipeline error"))
+                yield event
+
+    async def aprocess_claim(self, claim_data: dict[str, Any]) -> dict[str, Any]:
+        """Async ``POST /api/v1/claims/process`` — for concurrent batch calls."""
+        client = _async_client(self.base_url, self.timeout)
+        resp = await client.post("/api/v1/claims/process", json=claim_data)
+        try:
+            resp.raise_for_status()
+        except httpx.HTTPStatusError as exc:
+            error_body = _safe_json(exc.response)
+            raise APIError(
+                f"HTTP {exc.response.status_code}: "
+                f"{error_body.get('detail', exc.response.text)}",
+                status_code=exc.response.status_code,
+            ) from exc
+        return resp.json()
+
+    async def aprocess_many(self, claims: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Process several claims concurrently over the shared AsyncClient.
+
+        Fans the requests out with a ``TaskGroup`` so total latency is the
+        max of the individual calls rather than their sum (e.g. when
+        reprocessing history entries in bulk).
+        """
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(self.aprocess_claim(claim)) for claim in claims]
+        return [task.result() for task in tasks]
+
+    def close(self) -> None:
+        """Close the underlying client and its pooled connections."""
+        self._client.close()
+
     # -----------------------------------------------------------------
     # Internal request helpers
     # -----------------------------------------------------------------
@@ -69,37 +163,47 @@ class ClaimAPIClient:
 
         for attempt in range(1, self.max_retries + 1):
             try:
-                resp = requests.request(
-                    method,
-                    url,
-                    timeout=self.timeout,
-                    **kwargs,
-                )
-                resp.raise_for_status()
-                return resp.json()
-            except requests.ConnectionError as exc:
+                resp = self._client.request(method, path, **kwargs)
+            except httpx.ConnectError as exc:
                 last_exc = exc
                 if attempt < self.max_retries:
-                    continue
-            except requests.HTTPError as exc:
-                # Don't retry client errors (4xx)
-                if exc.response is not None and exc.response.status_code < 500:
-                    error_body = _safe_json(exc.response)
-                    raise APIError(
-                        f"HTTP {exc.response.status_code}: "
-                        f"{error_body.get('detail', exc.response.text)}",
-                        status_code=exc.response.status_code,
-                    ) from exc
+                    self._backoff(attempt)
+                continue
+            except httpx.TimeoutException as exc:
                 last_exc = exc
                 if attempt < self.max_retries:
-                    continue
-            except requests.Timeout as exc:
-                last_exc = exc
+                    self._backoff(attempt)
+                continue
+
+            status = resp.status_code
+            if status < 400:
+                # Single body scan + parse — no raise_for_status / resp.json() double pass
+                return _parse_body(resp)
+
+            # Don't retry client errors (4xx)
+            if status < 500:
+                error_body = _safe_json(resp)
+                raise APIError(
+                    f"HTTP {status}: {error_body.get('detail', resp.text)}",
+                    status_code=status,
+                )
+
+            last_exc = APIError(f"HTTP {status}: server error", status_code=status)
+            if attempt < self.max_retries:
+                self._backoff(attempt)
 
         raise APIError(
             f"Request to {url} failed after {self.max_retries} attempts: {last_exc}",
         )
 
+    def _backoff(self, attempt: int) -> None:
+        """Sleep with exponential backoff + jitter before the next attempt."""
+        delay = min(
+            self.max_delay,
+            self.base_delay * (2 ** (attempt - 1)) * (1 + random.uniform(0, self.jitter)),
+        )
+        time.sleep(delay)
+
 
 # ---------------------------------------------------------------------------
 # Custom exception
@@ -118,10 +222,35 @@ class APIError(Exception):
 # Helpers
 # ---------------------------------------------------------------------------
 
+# Lazily created AsyncClient shared across async calls (keyed per base_url)
+_ASYNC_CLIENTS: dict[str, httpx.AsyncClient] = {}
 
-def _safe_json(resp: requests.Response) -> dict[str, Any]:
+
+def _async_client(base_url: str, timeout: int) -> httpx.AsyncClient:
+    """Return (creating if needed) the shared ``httpx.AsyncClient`` for *base_url*."""
+    client = _ASYNC_CLIENTS.get(base_url)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            base_url=base_url,
+            timeout=timeout,
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=5),
+            headers=_DEFAULT_HEADERS,
+        )
+        _ASYNC_CLIENTS[base_url] = client
+    return client
+
+
+def _parse_body(resp: httpx.Response) -> dict[str, Any]:
+    """Parse a response body as JSON in one pass."""
+    if orjson is not None:
+        return orjson.loads(resp.content)
+    return resp.json()
+
+
+def _safe_json(resp: httpx.Response) -> dict[str, Any]:
     """Try to parse a response body as JSON, returning ``{}`` on failure."""
     try:
-        return resp.json()
+        return _parse_body(resp)
     except Exception:
         return {}
@@ -7,9 +7,12 @@ Run with::
 
 from __future__ import annotations
 
+import atexit
+from collections import deque
+
 import streamlit as st
 from api_client import APIError, ClaimAPIClient
-from components.claim_form import SAMPLE_CLAIMS, render_claim_form
+from components.claim_form import SAMPLE_CLAIMS, SAMPLE_KEYS, render_claim_form
 from components.result_card import render_result_card
 from components.trace_viewer import render_trace_viewer
 from styles import inject_global_styles, render_header
@@ -35,34 +38,78 @@ inject_global_styles()
 # Session state defaults
 # ---------------------------------------------------------------------------
 
+# Ring buffer — caps sidebar rendering and websocket state sync at 20 entries
+_HISTORY_MAX = 20
+
 if "history" not in st.session_state:
-    st.session_state.history: list[dict] = []
+    st.session_state.history = deque(maxlen=_HISTORY_MAX)
 
 # ---------------------------------------------------------------------------
 # API client
 # ---------------------------------------------------------------------------
 
-client = ClaimAPIClient()
+@st.cache_resource(show_spinner=False)
+def get_client() -> ClaimAPIClient:
+    """Build the API client once per server process so its pool survives reruns."""
+    _client = ClaimAPIClient()
+    atexit.register(_client.close)
+    return _client
 
-# ---------------------------------------------------------------------------
-# Sidebar
-# ---------------------------------------------------------------------------
 
-with st.sidebar:
-    st.markdown("### ⚙️ Configuration")
+client = get_client()
 
-    # API connection status
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_health(base_url: str) -> dict:
+    """Memoized health check — avoids an HTTP round-trip on every rerun."""
+    return ClaimAPIClient(base_url).health_check()
+
+
+# Fragments (Streamlit >= 1.33) rerun only the decorated region instead of the
+# whole script — fall back to plain functions on older versions.
+_HAS_FRAGMENT = hasattr(st, "fragment")
+
+
+def _render_api_status() -> None:
+    """Sidebar API liveness block — refreshes itself without a full rerun."""
     st.markdown("**API Status**")
     try:
-        health = client.health_check()
+        health = _cached_health(client.base_url)
         st.success(f"Connected — pipeline: `{health.get('pipeline', '?')}`")
-        pipeline_type = health.get("pipeline", "unknown")
     except APIError as exc:
         st.error(f"API error: {exc}")
-        pipeline_type = "unknown"
     except Exception:
         st.error("Cannot reach backend API")
-        pipeline_type = "unknown"
+
+
+def _claim_form_section() -> None:
+    """Claim form region — typing in fields reruns only this fragment.
+
+    A submitted claim is handed off via ``st.session_state`` so the
+    processing logic below (outside the fragment) can pick it up on the
+    next full-app run.
+    """
+    st.markdown("### Submit a Claim")
+    claim_data = render_claim_form()
+    if claim_data is not None:
+        st.session_state["pending_claim"] = claim_data
+        if _HAS_FRAGMENT:
+            st.rerun(scope="app")
+
+
+if _HAS_FRAGMENT:
+    _render_api_status = st.fragment(run_every=30)(_render_api_status)
+    _claim_form_section = st.fragment(_claim_form_section)
+
+# ---------------------------------------------------------------------------
+# Sidebar
+# ---------------------------------------------------------------------------
+
+with st.sidebar:
+    st.markdown("### ⚙️ Configuration")
+
+    # API connection status
+    _render_api_status()
 
     st.divider()
 
@@ -70,11 +117,13 @@ with st.sidebar:
     st.markdown("**Quick Load Sample Claim**")
     sample_choice = st.selectbox(
         "Select a sample",
-        options=["— Select —"] + list(SAMPLE_CLAIMS.keys()),
+        options=["— Select —"] + SAMPLE_KEYS,
         key="sample_select",
     )
 
-    if sample_choice != "— Select —":
+    # Only write the form keys when the selection actually changed — avoids
+    # six session_state writes (and widget reconciliation) on every rerun.
+    if sample_choice != "— Select —" and st.session_state.get("_applied_sample") != sample_choice:
         sample = SAMPLE_CLAIMS[sample_choice]
         st.session_state["form_claim_num"] = sample["claim_number"]
         st.session_state["form_policy_num"] = sample["policy_number"]
@@ -82,6 +131,7 @@ with st.sidebar:
         st.session_state["form_desc"] = sample["loss_description"]
         st.session_state["form_cost"] = sample["estimated_repair_cost"]
         st.session_state["form_vehicle"] = sample.get("vehicle_details", "")
+        st.session_state["_applied_sample"] = sample_choice
 
     st.divider()
 
@@ -94,7 +144,7 @@ with st.sidebar:
             st.caption(f"{status} {dec.get('claim_number', '?')}")
 
         if st.button("Clear History", key="btn_clear"):
-            st.session_state.history = []
+            st.session_state.history = deque(maxlen=_HISTORY_MAX)
             st.rerun()
 
 # ---------------------------------------------------------------------------
@@ -104,20 +154,28 @@ with st.sidebar:
 render_header()
 
 # ── Claim Form ───────────────────────────────────────────────────────
-st.markdown("### Submit a Claim")
-claim_data = render_claim_form()
+_claim_form_section()
+claim_data = st.session_state.pop("pending_claim", None)
 
 # ── Processing ───────────────────────────────────────────────────────
 if claim_data is not None:
-    with st.spinner("Processing claim… this may take a minute."):
-        try:
-            result = client.process_claim(claim_data)
-        except APIError as exc:
-            st.error(f"API returned an error: {exc}")
-            result = None
-        except Exception as exc:
-            st.error(f"Unexpected error: {exc}")
-            result = None
+    result = None
+    try:
+        with st.status("Processing claim… this may take a minute.", expanded=False) as status:
+            # Consume NDJSON events as they arrive instead of buffering the
+            # full response — the UI updates while the pipeline runs.
+            for event in client.process_claim_stream(claim_data):
+                if event.get("event") == "status":
+                    status.update(label=event.get("message", "Processing…"))
+                elif event.get("event") == "decision":
+                    result = event.get("decision")
+            status.update(label="Claim processed", state="complete")
+    except APIError as exc:
+        st.error(f"API returned an error: {exc}")
+        result = None
+    except Exception as exc:
+        st.error(f"Unexpected error: {exc}")
+        result = None
 
     if result is not None:
         # Store in history
@@ -7,6 +7,11 @@ from datetime import date
 
 import streamlit as st
 
+try:  # orjson is ~5x faster for large pasted/uploaded payloads
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
 # ---------------------------------------------------------------------------
 # Sample claim data for quick demo
 # ---------------------------------------------------------------------------
@@ -50,6 +55,9 @@ SAMPLE_CLAIMS: dict[str, dict] = {
     },
 }
 
+# Precomputed once — the sidebar selectbox options never change between reruns
+SAMPLE_KEYS = list(SAMPLE_CLAIMS.keys())
+
 
 def render_claim_form() -> dict | None:
     """Render the claim input form and return the claim data dict or ``None``.
@@ -152,7 +160,7 @@ def _json_editor() -> dict | None:
     st.markdown("Paste claim JSON below or upload a `.json` file.")
 
     uploaded = st.file_uploader("Upload JSON file", type=["json"], key="json_upload")
-    default_json = json.dumps(SAMPLE_CLAIMS["Valid claim (PN-2)"], indent=2)
+    default_json = _dumps_pretty(SAMPLE_CLAIMS["Valid claim (PN-2)"])
 
     if uploaded is not None:
         try:
@@ -167,8 +175,8 @@ def _json_editor() -> dict | None:
 
     if st.button("🚀 Process Claim", key="btn_json", type="primary", use_container_width=True):
         try:
-            data = json.loads(json_text)
-        except json.JSONDecodeError as exc:
+            data = _loads(json_text)
+        except ValueError as exc:  # covers both json and orjson decode errors
             st.error(f"Invalid JSON: {exc}")
             return None
 
@@ -179,3 +187,20 @@ def _json_editor() -> dict | None:
         return data
 
     return None
+
+
+# ---------------------------------------------------------------------------
+# JSON helpers (orjson when available, stdlib fallback)
+# ---------------------------------------------------------------------------
+
+
+def _loads(text: str) -> object:
+    if orjson is not None:
+        return orjson.loads(text.encode())
+    return json.loads(text)
+
+
+def _dumps_pretty(data: dict) -> str:
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(data, indent=2)
@@ -2,10 +2,26 @@
 
 from __future__ import annotations
 
+import re
 from typing import Any
 
 import streamlit as st
 
+# Lines look like:  [node_name] 0.42s — key=val | key2=val2
+_TRACE_RE = re.compile(r"^\[(?P<node>[^\]]+)\]\s*(?P<timing>[^—]*?)\s*(?:—\s*(?P<details>.*))?$")
+
+# Icon per known node name
+_ICONS = {
+    "parse_claim": "📄",
+    "validate_claim": "✅",
+    "check_policy": "📜",
+    "price_check": "💰",
+    "generate_recommendation": "🤖",
+    "finalize_decision": "✔️",
+    "finalize_invalid": "❌",
+    "finalize_inflated": "⚠️",
+}
+
 
 def render_trace_viewer(decision: dict[str, Any]) -> None:
     """Render an expandable trace section from the decision notes.
@@ -36,46 +52,31 @@ def render_trace_viewer(decision: dict[str, Any]) -> None:
         return
 
     with st.expander("🔍 Processing Trace", expanded=False):
+        # Build one HTML string and emit a single markdown call — one forward
+        # message to the browser instead of one per trace line.
+        parts: list[str] = []
         for line in trace_lines:
-            _render_trace_line(line)
-
-
-def _render_trace_line(line: str) -> None:
-    """Render a single trace line as a styled step card."""
-    # Lines look like:  [node_name] 0.42s — key=val | key2=val2
-    # Extract the node name
-    if line.startswith("["):
-        bracket_end = line.index("]")
-        node = line[1:bracket_end]
-        rest = line[bracket_end + 1 :].strip()
-
-        # Icon mapping
-        icons = {
-            "parse_claim": "📄",
-            "validate_claim": "✅",
-            "check_policy": "📜",
-            "price_check": "💰",
-            "generate_recommendation": "🤖",
-            "finalize_decision": "✔️",
-            "finalize_invalid": "❌",
-            "finalize_inflated": "⚠️",
-        }
-        icon = icons.get(node, "🔹")
-
-        # Parse timing and details
-        parts = rest.split("—", 1)
-        timing = parts[0].strip() if parts else ""
-        details = parts[1].strip() if len(parts) > 1 else ""
-
-        st.markdown(
+            _render_trace_line(line, parts)
+        st.markdown("".join(parts), unsafe_allow_html=True)
+
+
+def _render_trace_line(line: str, parts: list[str]) -> None:
+    """Append the HTML for a single trace step card to *parts*."""
+    m = _TRACE_RE.match(line)
+    if m:
+        node = m.group("node")
+        icon = _ICONS.get(node, "🔹")
+        timing = m.group("timing") or ""
+        details = m.group("details") or ""
+
+        parts.append(
             f"""
             <div class="trace-step">
                 <strong>{icon} {node}</strong>
                 <span style="float:right; color:#7f8c8d;">{timing}</span>
                 {"<br/><small>" + details + "</small>" if details else ""}
             </div>
-            """,
-            unsafe_allow_html=True,
+            """
         )
     else:
-        st.markdown(f"<div class='trace-step'>{line}</div>", unsafe_allow_html=True)
+        parts.append(f"<div class='trace-step'>{line}</div>")
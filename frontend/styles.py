@@ -124,21 +124,34 @@ section[data-testid="stSidebar"] {{
 
 _GLOBAL_CSS = _build_css()
 
+_HEADER_HTML = """
+<div class="app-header">
+    <h1>🛡️ Insurance Claim Processing Agent</h1>
+    <p>Agentic RAG — Intelligent claim validation,
+    policy retrieval &amp; coverage decisions</p>
+</div>
+"""
+
+
+@st.cache_resource(show_spinner=False)
+def _css_injected() -> bool:
+    """Emit the global CSS once per server process (markup never changes)."""
+    st.markdown(_GLOBAL_CSS, unsafe_allow_html=True)
+    return True
+
+
+@st.cache_resource(show_spinner=False)
+def _header_rendered() -> bool:
+    """Emit the static header markup once per server process."""
+    st.markdown(_HEADER_HTML, unsafe_allow_html=True)
+    return True
+
 
 def inject_global_styles() -> None:
     """Inject the global CSS into the Streamlit page."""
-    st.markdown(_GLOBAL_CSS, unsafe_allow_html=True)
+    _css_injected()
 
 
 def render_header() -> None:
     """Render the branded application header."""
-    st.markdown(
-        """
-        <div class="app-header">
-            <h1>🛡️ Insurance Claim Processing Agent</h1>
-            <p>Agentic RAG — Intelligent claim validation,
-            policy retrieval &amp; coverage decisions</p>
-        </div>
-        """,
-        unsafe_allow_html=True,
-    )
+    _header_rendered()
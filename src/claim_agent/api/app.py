@@ -10,7 +10,9 @@
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import AsyncIterator
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -39,25 +41,46 @@ async def _lifespan(app: FastAPI) -> AsyncIterator[None]:
     """Startup / shutdown lifecycle for the FastAPI application."""
     cfg: DictConfig = app.state.cfg
 
-    # ── Startup: ingest policy PDF if needed ─────────────────────────────
+    # ── Startup: bounded executor for the synchronous pipelines ─────────
+    # A dedicated pool caps concurrent claim processing (rather than sharing
+    # Starlette's default threadpool) and makes queueing observable.
+    app.state.pipeline_executor = ThreadPoolExecutor(
+        max_workers=int(cfg.server.get("max_workers", 4)),
+        thread_name_prefix="pipeline",
+    )
+
+    # ── Startup: ingest policy PDF in the background ─────────────────────
+    # Ingestion (extract + embed) can take tens of seconds; running it off
+    # the critical path lets /health and other endpoints respond immediately.
+    app.state.ingest_ready = asyncio.Event()
     pdf_path = Path(cfg.data.policy_pdf)
-    if pdf_path.exists():
+
+    async def _ingest() -> None:
         try:
-            ingest_policy_pdf(
+            await asyncio.to_thread(
+                ingest_policy_pdf,
                 pdf_path=str(pdf_path),
                 chroma_persist_dir=cfg.data.chroma_persist_dir,
                 collection_name=cfg.vectordb.collection_name,
                 embedding_model=cfg.vectordb.embedding_model,
                 chunk_size=cfg.vectordb.chunk_size,
                 chunk_overlap=cfg.vectordb.chunk_overlap,
+                embedding_dimensions=cfg.vectordb.get("embedding_dimensions"),
             )
         except Exception as exc:
             logger.warning("PDF ingestion skipped or failed: {e}", e=exc)
+        finally:
+            app.state.ingest_ready.set()
+
+    if pdf_path.exists():
+        app.state.ingest_task = asyncio.create_task(_ingest())
     else:
         logger.info("No policy PDF at {path} — skipping ingestion", path=pdf_path)
+        app.state.ingest_ready.set()
 
     logger.info("Application startup complete")
     yield
+    app.state.pipeline_executor.shutdown(wait=False, cancel_futures=True)
     logger.info("Application shutting down")
 
 
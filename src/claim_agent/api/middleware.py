@@ -1,43 +1,56 @@
-"""Custom ASGI middleware for request logging and exception handling."""
+"""Custom ASGI middleware for request logging and exception handling.
+
+Both classes are pure ASGI middleware rather than ``BaseHTTPMiddleware``
+subclasses — this avoids Starlette's per-request task group and memory-stream
+buffering, and keeps streaming responses unbuffered.
+"""
 
 from __future__ import annotations
 
+import json
 import time
-import traceback
 
 from loguru import logger
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
-from starlette.requests import Request
-from starlette.responses import JSONResponse, Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 # ---------------------------------------------------------------------------
 # Request logging
 # ---------------------------------------------------------------------------
 
 
-class RequestLoggingMiddleware(BaseHTTPMiddleware):
+class RequestLoggingMiddleware:
     """Log every request with method, path, status code, and duration."""
 
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: RequestResponseEndpoint,
-    ) -> Response:
-        start = time.time()
-        method = request.method
-        path = request.url.path
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        method = scope["method"]
+        path = scope["path"]
+        status: int | None = None
 
-        response = await call_next(request)
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
 
-        elapsed_ms = (time.time() - start) * 1000
-        logger.info(
-            "{method} {path} → {status} ({ms:.0f}ms)",
-            method=method,
-            path=path,
-            status=response.status_code,
-            ms=elapsed_ms,
-        )
-        return response
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            logger.info(
+                "{method} {path} → {status} ({ms:.0f}ms)",
+                method=method,
+                path=path,
+                status=status,
+                ms=elapsed_ms,
+            )
 
 
 # ---------------------------------------------------------------------------
@@ -45,28 +58,47 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
 # ---------------------------------------------------------------------------
 
 
-class ExceptionHandlerMiddleware(BaseHTTPMiddleware):
+class ExceptionHandlerMiddleware:
     """Catch unhandled exceptions and return a structured 500 response."""
 
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: RequestResponseEndpoint,
-    ) -> Response:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        response_started = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
         try:
-            return await call_next(request)
+            await self.app(scope, receive, send_wrapper)
         except Exception as exc:
-            logger.error(
-                "Unhandled exception on {method} {path}: {err}\n{tb}",
-                method=request.method,
-                path=request.url.path,
-                err=exc,
-                tb=traceback.format_exc(),
+            # opt(exception=...) defers traceback formatting to the sink — free
+            # when the record is filtered out
+            logger.opt(exception=exc).error(
+                "Unhandled exception on {method} {path}",
+                method=scope["method"],
+                path=scope["path"],
             )
-            return JSONResponse(
-                status_code=500,
-                content={
-                    "detail": "Internal server error",
-                    "error": str(exc),
-                },
+            if response_started:
+                # Headers already sent — too late for a clean 500
+                raise
+            body = json.dumps({"detail": "Internal server error", "error": str(exc)}).encode()
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": 500,
+                    "headers": [
+                        (b"content-type", b"application/json"),
+                        (b"content-length", str(len(body)).encode()),
+                    ],
+                }
             )
+            await send({"type": "http.response.body", "body": body})
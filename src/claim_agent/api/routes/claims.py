@@ -5,6 +5,9 @@ Endpoints
 POST /api/v1/claims/process
     Accept a ``ClaimInfo`` JSON body, run the pipeline, return ``ClaimDecision``.
 
+POST /api/v1/claims/process/stream
+    Same, but stream progress events and the decision as NDJSON lines.
+
 GET  /api/v1/health
     Lightweight health-check.
 
@@ -14,11 +17,15 @@ GET  /api/v1/pipelines
 
 from __future__ import annotations
 
-import traceback
+import asyncio
+import json
+from collections.abc import AsyncIterator
 
 from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import StreamingResponse
 from loguru import logger
 from pydantic import ValidationError
+from starlette.concurrency import run_in_threadpool
 
 from claim_agent.schemas.claim import ClaimDecision, ClaimInfo
 
@@ -28,6 +35,20 @@ router = APIRouter()
 _PIPELINE_TYPES = ["langchain", "smolagents"]
 
 
+async def _run_pipeline(request: Request, claim: ClaimInfo) -> ClaimDecision:
+    """Run the blocking pipeline on the app's bounded executor.
+
+    Falls back to Starlette's shared threadpool when no executor is
+    registered (e.g. apps built without the lifespan in tests).
+    """
+    pipeline = request.app.state.pipeline
+    executor = getattr(request.app.state, "pipeline_executor", None)
+    if executor is None:
+        return await run_in_threadpool(pipeline.process_claim, claim)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, pipeline.process_claim, claim)
+
+
 # ---------------------------------------------------------------------------
 # POST /claims/process
 # ---------------------------------------------------------------------------
@@ -45,12 +66,13 @@ async def process_claim(claim: ClaimInfo, request: Request) -> ClaimDecision:
     The active pipeline (LangChain or Smolagents) is resolved at startup and
     stored in ``app.state.pipeline``.
     """
-    pipeline = request.app.state.pipeline
     claim_num = claim.claim_number
     logger.info("API: received claim {num}", num=claim_num)
 
     try:
-        decision = pipeline.process_claim(claim)
+        # The pipelines are synchronous (embedding + Chroma query + LLM calls);
+        # run them off the event loop so concurrent requests don't serialize.
+        decision = await _run_pipeline(request, claim)
     except ValidationError as exc:
         logger.warning(
             "Validation error processing claim {num}: {err}",
@@ -59,11 +81,9 @@ async def process_claim(claim: ClaimInfo, request: Request) -> ClaimDecision:
         )
         raise HTTPException(status_code=422, detail=str(exc)) from exc
     except Exception as exc:
-        logger.error(
-            "Pipeline error processing claim {num}: {err}\n{tb}",
+        logger.opt(exception=exc).error(
+            "Pipeline error processing claim {num}",
             num=claim_num,
-            err=exc,
-            tb=traceback.format_exc(),
         )
         raise HTTPException(
             status_code=500,
@@ -78,6 +98,45 @@ async def process_claim(claim: ClaimInfo, request: Request) -> ClaimDecision:
     return decision
 
 
+# ---------------------------------------------------------------------------
+# POST /claims/process/stream
+# ---------------------------------------------------------------------------
+
+
+@router.post(
+    "/claims/process/stream",
+    summary="Process an insurance claim (streaming)",
+    description="Submit a claim and receive progress events plus the decision as NDJSON.",
+)
+async def process_claim_stream(claim: ClaimInfo, request: Request) -> StreamingResponse:
+    """Process a claim, streaming NDJSON events so clients can render progress.
+
+    Each line is a JSON object with an ``event`` key: ``status`` while the
+    pipeline is running, then either ``decision`` (with the full
+    ``ClaimDecision``) or ``error``.
+    """
+    claim_num = claim.claim_number
+    logger.info("API: received claim {num} (streaming)", num=claim_num)
+
+    async def _events() -> AsyncIterator[str]:
+        yield json.dumps({"event": "status", "message": f"Processing claim {claim_num}…"}) + "\n"
+        try:
+            # Run the blocking pipeline off the event loop
+            decision = await _run_pipeline(request, claim)
+        except Exception as exc:
+            logger.opt(exception=exc).error(
+                "Pipeline error processing claim {num}",
+                num=claim_num,
+            )
+            yield json.dumps({"event": "error", "detail": f"Pipeline error: {exc}"}) + "\n"
+            return
+        # model_dump_json serializes in pydantic-core (Rust) — skip the
+        # Python-level mode="json" walk plus a second stdlib json.dumps pass
+        yield f'{{"event": "decision", "decision": {decision.model_dump_json()}}}\n'
+
+    return StreamingResponse(_events(), media_type="application/x-ndjson")
+
+
 # ---------------------------------------------------------------------------
 # GET /health
 # ---------------------------------------------------------------------------
@@ -91,7 +150,12 @@ async def process_claim(claim: ClaimInfo, request: Request) -> ClaimDecision:
 async def health(request: Request) -> dict:
     """Return a lightweight health-check response."""
     pipeline_type = request.app.state.cfg.pipeline.type
-    return {"status": "healthy", "pipeline": pipeline_type}
+    ingest_ready = getattr(request.app.state, "ingest_ready", None)
+    return {
+        "status": "healthy",
+        "pipeline": pipeline_type,
+        "ingest_ready": ingest_ready.is_set() if ingest_ready is not None else True,
+    }
 
 
 # ---------------------------------------------------------------------------
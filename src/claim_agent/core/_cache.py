@@ -0,0 +1,53 @@
+"""Process-wide caches for expensive clients shared by ingestion and retrieval.
+
+Opening a ``chromadb.PersistentClient`` re-reads the SQLite/HNSW index and
+constructing an ``OpenAI`` client re-builds its connection pool; neither
+should happen per request.  Everything here is memoized with
+``functools.lru_cache`` so ``make ingest`` followed by server start reuses
+warm artifacts within the same process.
+"""
+
+from __future__ import annotations
+
+import os
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import chromadb
+    from chromadb.api.models.Collection import Collection
+    from openai import OpenAI
+
+
+@lru_cache(maxsize=4)
+def get_chroma_client(persist_dir: str) -> chromadb.ClientAPI:
+    """Return the (cached) persistent Chroma client for *persist_dir*."""
+    import chromadb  # deferred — ~200ms import paid only when a client is needed
+
+    return chromadb.PersistentClient(path=persist_dir)
+
+
+@lru_cache(maxsize=8)
+def get_collection(persist_dir: str, collection_name: str) -> Collection:
+    """Return the (cached) Chroma collection handle.
+
+    Call :func:`invalidate_collections` after deleting or recreating a
+    collection — cached handles reference the old collection id.
+    """
+    return get_chroma_client(persist_dir).get_collection(name=collection_name)
+
+
+def invalidate_collections() -> None:
+    """Drop cached collection handles (after a collection rebuild)."""
+    get_collection.cache_clear()
+
+
+@lru_cache(maxsize=1)
+def get_openai_client() -> OpenAI:
+    """Return the shared OpenAI client used for embedding calls."""
+    from openai import OpenAI  # deferred — paid only on the first embedding call
+
+    return OpenAI(
+        api_key=os.environ.get("OPENAI_API_KEY"),
+        base_url=os.environ.get("OPENAI_BASE_URL") or None,
+    )
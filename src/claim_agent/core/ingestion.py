@@ -7,13 +7,19 @@ Can be run standalone via ``python -m claim_agent.core.ingestion`` (used by
 from __future__ import annotations
 
 import hashlib
-import os
+import json
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 
-import chromadb
+import xxhash
 from loguru import logger
-from openai import OpenAI
-from PyPDF2 import PdfReader
+
+from claim_agent.core._cache import get_chroma_client, get_openai_client, invalidate_collections
+
+try:  # optional native SIMD chunker — splits at delimiters far faster than Python
+    from memchunk import chunk as _mc_chunk  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover
+    _mc_chunk = None  # type: ignore[assignment]
 
 # ---------------------------------------------------------------------------
 # Public API
@@ -27,6 +33,7 @@ def ingest_policy_pdf(
     embedding_model: str,
     chunk_size: int = 500,
     chunk_overlap: int = 50,
+    embedding_dimensions: int | None = None,
 ) -> None:
     """Extract text from *pdf_path*, chunk it, embed, and persist to ChromaDB.
 
@@ -47,6 +54,9 @@ def ingest_policy_pdf(
         Maximum number of characters per chunk.
     chunk_overlap:
         Number of overlapping characters between consecutive chunks.
+    embedding_dimensions:
+        Optional truncated dimension for text-embedding-3 models — smaller
+        vectors shrink the index and speed up queries at minimal quality cost.
     """
     pdf_file = Path(pdf_path)
     if not pdf_file.exists():
@@ -56,53 +66,97 @@ def ingest_policy_pdf(
     # ── Connect to (or create) the ChromaDB persistent client ───────────
     persist_dir = Path(chroma_persist_dir)
     persist_dir.mkdir(parents=True, exist_ok=True)
-    client = chromadb.PersistentClient(path=str(persist_dir))
+    client = get_chroma_client(str(persist_dir))
     collection = client.get_or_create_collection(name=collection_name)
 
     # ── Idempotency check ───────────────────────────────────────────────
+    # Skip when the collection is warm, unless the PDF changed since the
+    # last ingestion (tracked via its mtime in the collection metadata).
+    pdf_mtime = pdf_file.stat().st_mtime
     existing_count = collection.count()
     if existing_count > 0:
+        meta = collection.metadata or {}
+        stored_mtime = meta.get("policy_pdf_mtime")
+        pdf_changed = stored_mtime is not None and pdf_mtime > stored_mtime
+        # Collections ingested under an older chunk-ID scheme must be rebuilt —
+        # upserting with new IDs would duplicate every chunk.
+        ids_stale = meta.get("chunk_id_version") != _CHUNK_ID_VERSION
+        if pdf_changed or ids_stale:
+            logger.info(
+                "Policy PDF or chunk-ID scheme changed — rebuilding collection '{name}'",
+                name=collection_name,
+            )
+            client.delete_collection(collection_name)
+            collection = client.create_collection(name=collection_name)
+            invalidate_collections()  # cached retrieval handles now point at the old id
+        else:
+            logger.info(
+                "Collection '{name}' already contains {n} documents — skipping ingestion",
+                name=collection_name,
+                n=existing_count,
+            )
+            return
+
+    # ── Check the content-hash cache ────────────────────────────────────
+    # Embedding is the expensive step; cache chunks + vectors keyed by the
+    # PDF's SHA-256 so rebuilding the collection (e.g. after a wipe) is free
+    # when the document itself hasn't changed.
+    pdf_hash = _file_sha256(pdf_file)
+    dim_tag = f"-{embedding_dimensions}" if embedding_dimensions else ""
+    cache_file = persist_dir / "_cache" / f"{pdf_hash}-{embedding_model}{dim_tag}.json"
+    cached = _load_embedding_cache(cache_file, chunk_size, chunk_overlap)
+
+    if cached is not None:
+        chunks, embeddings = cached
+        logger.info("Loaded {n} chunks + embeddings from cache {f}", n=len(chunks), f=cache_file)
+    else:
+        # ── Extract + chunk as a streaming pipeline ─────────────────────
+        # Pages feed paragraphs straight into the chunker; the full document
+        # text never exists as one intermediate string.
+        logger.info("Extracting text from {path}", path=pdf_path)
+        chunks = list(
+            _chunk_paragraphs(
+                _iter_pdf_paragraphs(pdf_file),
+                chunk_size=chunk_size,
+                chunk_overlap=chunk_overlap,
+            )
+        )
+        if not chunks:
+            logger.warning("PDF appears to contain no extractable text")
+            return
         logger.info(
-            "Collection '{name}' already contains {n} documents — skipping ingestion",
-            name=collection_name,
-            n=existing_count,
+            "Created {n} chunks (size={sz}, overlap={ov})",
+            n=len(chunks),
+            sz=chunk_size,
+            ov=chunk_overlap,
         )
-        return
-
-    # ── Extract text from PDF ───────────────────────────────────────────
-    logger.info("Extracting text from {path}", path=pdf_path)
-    raw_text = _extract_pdf_text(pdf_file)
-    if not raw_text.strip():
-        logger.warning("PDF appears to contain no extractable text")
-        return
-
-    # ── Chunk the text ──────────────────────────────────────────────────
-    chunks = _chunk_text(raw_text, chunk_size=chunk_size, chunk_overlap=chunk_overlap)
-    logger.info(
-        "Created {n} chunks (size={sz}, overlap={ov})",
-        n=len(chunks),
-        sz=chunk_size,
-        ov=chunk_overlap,
-    )
 
-    # ── Embed chunks via OpenAI ─────────────────────────────────────
-    logger.info("Embedding {n} chunks with model: {model}", n=len(chunks), model=embedding_model)
-    _client = OpenAI(
-        api_key=os.environ.get("OPENAI_API_KEY"),
-        base_url=os.environ.get("OPENAI_BASE_URL") or None,
-    )
-    response = _client.embeddings.create(input=chunks, model=embedding_model)
-    embeddings = [item.embedding for item in response.data]
+        # ── Embed chunks via OpenAI ─────────────────────────────────────
+        logger.info(
+            "Embedding {n} chunks with model: {model}", n=len(chunks), model=embedding_model
+        )
+        embeddings = _embed_chunks(chunks, embedding_model, embedding_dimensions)
+        _save_embedding_cache(cache_file, chunks, embeddings, chunk_size, chunk_overlap)
 
     # ── Store in ChromaDB ───────────────────────────────────────────────
     ids = [_chunk_id(i, chunk) for i, chunk in enumerate(chunks)]
     metadatas = [{"source": str(pdf_file.name), "chunk_index": i} for i in range(len(chunks))]
 
-    collection.add(
-        ids=ids,
-        documents=chunks,
-        embeddings=embeddings,
-        metadatas=metadatas,
+    # Chroma enforces a per-call record cap (client.max_batch_size); slice the
+    # insert so ingestion doesn't blow up on large policy documents.
+    max_batch = getattr(client, "max_batch_size", 5000)
+    for start in range(0, len(chunks), max_batch):
+        end = start + max_batch
+        collection.upsert(
+            ids=ids[start:end],
+            documents=chunks[start:end],
+            embeddings=embeddings[start:end],
+            metadatas=metadatas[start:end],
+        )
+
+    # Record the source PDF's mtime so warm restarts can skip re-ingestion
+    collection.modify(
+        metadata={"policy_pdf_mtime": pdf_mtime, "chunk_id_version": _CHUNK_ID_VERSION}
     )
 
     logger.info(
@@ -118,64 +172,170 @@ def ingest_policy_pdf(
 # ---------------------------------------------------------------------------
 
 
-def _extract_pdf_text(pdf_path: Path) -> str:
-    """Read all pages from a PDF and return concatenated text."""
+def _file_sha256(path: Path) -> str:
+    """SHA-256 of a file's contents, streamed at C level."""
+    with path.open("rb") as fh:
+        return hashlib.file_digest(fh, "sha256").hexdigest()
+
+
+def _load_embedding_cache(
+    cache_file: Path, chunk_size: int, chunk_overlap: int
+) -> tuple[list[str], list[list[float]]] | None:
+    """Return cached ``(chunks, embeddings)`` if valid for these settings."""
+    if not cache_file.exists():
+        return None
+    try:
+        payload = json.loads(cache_file.read_text())
+        if payload["chunk_size"] != chunk_size or payload["chunk_overlap"] != chunk_overlap:
+            return None
+        return payload["chunks"], payload["embeddings"]
+    except (ValueError, KeyError) as exc:
+        logger.warning("Ignoring corrupt embedding cache {f}: {e}", f=cache_file, e=exc)
+        return None
+
+
+def _save_embedding_cache(
+    cache_file: Path,
+    chunks: list[str],
+    embeddings: list[list[float]],
+    chunk_size: int,
+    chunk_overlap: int,
+) -> None:
+    """Persist chunks + embeddings for reuse on the next cold ingestion."""
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    cache_file.write_text(
+        json.dumps(
+            {
+                "chunk_size": chunk_size,
+                "chunk_overlap": chunk_overlap,
+                "chunks": chunks,
+                "embeddings": embeddings,
+            }
+        )
+    )
+
+
+# OpenAI rejects embedding requests with more than 2048 inputs; staying well
+# below that also keeps each request's payload (and retry cost) bounded.
+_EMBED_BATCH_SIZE = 512
+
+
+def _embed_chunks(
+    chunks: list[str], embedding_model: str, embedding_dimensions: int | None = None
+) -> list[list[float]]:
+    """Embed *chunks* in fixed-size batches and return their vectors in order."""
+    client = get_openai_client()
+    extra: dict = {"dimensions": embedding_dimensions} if embedding_dimensions else {}
+    embeddings: list[list[float]] = []
+    for start in range(0, len(chunks), _EMBED_BATCH_SIZE):
+        batch = chunks[start : start + _EMBED_BATCH_SIZE]
+        response = client.embeddings.create(input=batch, model=embedding_model, **extra)
+        embeddings.extend(item.embedding for item in response.data)
+        logger.debug(
+            "Embedded batch {a}-{b} of {n}",
+            a=start,
+            b=start + len(batch),
+            n=len(chunks),
+        )
+    return embeddings
+
+
+def _iter_pdf_paragraphs(pdf_path: Path) -> Iterator[str]:
+    """Yield non-empty paragraphs from a PDF, page by page.
+
+    Uses PyMuPDF when available (much faster page parsing) and falls back
+    to PyPDF2 otherwise.  Both are imported here rather than at module level
+    so server startup doesn't pay for a parser that may never run.  Yielding
+    paragraphs directly avoids materialising the full document text before
+    chunking.
+    """
+    try:
+        import fitz  # type: ignore[import-untyped]
+    except ImportError:  # pragma: no cover
+        fitz = None
+
+    if fitz is not None:
+        with fitz.open(str(pdf_path)) as doc:
+            for i, page in enumerate(doc):
+                text = page.get_text() or ""
+                if text.strip():
+                    logger.debug("Page {i}: extracted {n} chars", i=i + 1, n=len(text))
+                    yield from (p.strip() for p in text.split("\n\n") if p.strip())
+        return
+
+    from PyPDF2 import PdfReader
+
     reader = PdfReader(str(pdf_path))
-    pages: list[str] = []
     for i, page in enumerate(reader.pages):
         text = page.extract_text() or ""
         if text.strip():
-            pages.append(text)
             logger.debug("Page {i}: extracted {n} chars", i=i + 1, n=len(text))
-    return "\n\n".join(pages)
+            yield from (p.strip() for p in text.split("\n\n") if p.strip())
 
 
-def _chunk_text(text: str, *, chunk_size: int, chunk_overlap: int) -> list[str]:
-    """Split *text* into overlapping chunks of roughly *chunk_size* characters.
+def _chunk_paragraphs(
+    paragraphs: Iterable[str], *, chunk_size: int, chunk_overlap: int
+) -> Iterator[str]:
+    """Stream *paragraphs* into overlapping chunks of roughly *chunk_size* chars.
 
-    Attempts to break on paragraph boundaries (double newlines) first, then
-    falls back to sentence-level or hard character splits.
+    Accumulates paragraphs until the next one would overflow the chunk, then
+    flushes — so at most one chunk's worth of text is buffered at a time.
+    When the optional ``memchunk`` native chunker is installed it does the
+    boundary scan instead, with overlap applied as a cheap post-pass.
     """
-    # Normalise whitespace within paragraphs but keep paragraph breaks
-    paragraphs = [p.strip() for p in text.split("\n\n") if p.strip()]
+    if _mc_chunk is not None:
+        text = "\n\n".join(paragraphs)
+        raw = [bytes(m).decode() for m in _mc_chunk(text, size=chunk_size, delimiters="\n.?!")]
+        for i, piece in enumerate(raw):
+            if i == 0 or not chunk_overlap:
+                yield piece
+            else:
+                yield f"{raw[i - 1][-chunk_overlap:]} {piece}".strip()
+        return
+
+    step = chunk_size - chunk_overlap
 
-    chunks: list[str] = []
-    current_chunk = ""
+    def _emit(chunk: str) -> Iterator[str]:
+        # Hard-split chunks that are still too long (single giant paragraphs)
+        if len(chunk) <= chunk_size:
+            yield chunk
+            return
+        for start in range(0, len(chunk), step):
+            end = min(start + chunk_size, len(chunk))
+            yield chunk[start:end]
+            if end == len(chunk):
+                break
+
+    current_parts: list[str] = []
+    current_len = 0
 
     for para in paragraphs:
         # If adding this paragraph would exceed the chunk size, flush
-        candidate = f"{current_chunk}\n\n{para}".strip() if current_chunk else para
-        if len(candidate) > chunk_size and current_chunk:
-            chunks.append(current_chunk)
+        added = len(para) + (2 if current_parts else 0)  # "\n\n" separator
+        if current_len + added > chunk_size and current_parts:
+            chunk = "\n\n".join(current_parts)
+            yield from _emit(chunk)
             # Start new chunk with overlap from the tail of the previous chunk
-            overlap_text = current_chunk[-chunk_overlap:] if chunk_overlap else ""
-            current_chunk = f"{overlap_text} {para}".strip() if overlap_text else para
+            overlap_text = chunk[-chunk_overlap:] if chunk_overlap else ""
+            current_parts = [f"{overlap_text} {para}".strip()] if overlap_text else [para]
+            current_len = len(current_parts[0])
         else:
-            current_chunk = candidate
+            current_parts.append(para)
+            current_len += added
 
     # Don't forget the last chunk
-    if current_chunk:
-        chunks.append(current_chunk)
+    if current_parts:
+        yield from _emit("\n\n".join(current_parts))
 
-    # Handle any chunks that are still too long (single giant paragraphs)
-    final_chunks: list[str] = []
-    for chunk in chunks:
-        if len(chunk) <= chunk_size:
-            final_chunks.append(chunk)
-        else:
-            # Hard-split long chunks
-            for start in range(0, len(chunk), chunk_size - chunk_overlap):
-                end = min(start + chunk_size, len(chunk))
-                final_chunks.append(chunk[start:end])
-                if end == len(chunk):
-                    break
 
-    return final_chunks
+# Bump when the chunk-ID scheme changes — stale collections with old-style IDs
+# are rebuilt rather than upserted into (different hash → duplicate rows).
+_CHUNK_ID_VERSION = 2
 
 
 def _chunk_id(index: int, text: str) -> str:
     """Deterministic chunk ID based on index + content hash."""
-    content_hash = hashlib.md5(text.encode()).hexdigest()[:8]
+    content_hash = xxhash.xxh3_64_hexdigest(text.encode())[:8]
     return f"chunk-{index:04d}-{content_hash}"
 
 
@@ -201,6 +361,7 @@ def _cli() -> None:
             embedding_model=cfg.vectordb.embedding_model,
             chunk_size=cfg.vectordb.chunk_size,
             chunk_overlap=cfg.vectordb.chunk_overlap,
+            embedding_dimensions=cfg.vectordb.get("embedding_dimensions"),
         )
 
     _main()
@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
-import os
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-import chromadb
+import xxhash
 from loguru import logger
-from openai import OpenAI
+
+from claim_agent.core._cache import get_collection, get_openai_client
+
+_hash_doc = xxhash.xxh3_64_intdigest
 
 
 def retrieve_policy_text(
@@ -16,6 +20,7 @@ def retrieve_policy_text(
     collection_name: str,
     embedding_model: str,
     n_results: int = 5,
+    embedding_dimensions: int | None = None,
 ) -> list[str]:
     """Embed *queries* and retrieve the most relevant policy text chunks.
 
@@ -31,6 +36,9 @@ def retrieve_policy_text(
         OpenAI embedding model identifier (e.g. ``text-embedding-3-small``).
     n_results:
         Maximum number of results to return **per query**.
+    embedding_dimensions:
+        Optional truncated dimension for text-embedding-3 models; must match
+        the dimension the collection was ingested with.
 
     Returns
     -------
@@ -45,10 +53,8 @@ def retrieve_policy_text(
         logger.error(msg)
         raise FileNotFoundError(msg)
 
-    client = chromadb.PersistentClient(path=str(persist_dir))
-
     try:
-        collection = client.get_collection(name=collection_name)
+        collection = get_collection(str(persist_dir), collection_name)
     except Exception:
         msg = (
             f"Collection '{collection_name}' not found in ChromaDB. "
@@ -72,31 +78,53 @@ def retrieve_policy_text(
     )
 
     # ── Embed queries via OpenAI ─────────────────────────────────────
-    _client = OpenAI(
-        api_key=os.environ.get("OPENAI_API_KEY"),
-        base_url=os.environ.get("OPENAI_BASE_URL") or None,
-    )
-    response = _client.embeddings.create(input=queries, model=embedding_model)
+    # Single batched call; drop duplicate queries first (order-preserving) so
+    # we don't pay embedding tokens or an extra HNSW search for repeats
+    queries = list(dict.fromkeys(queries))
+    embed_kwargs: dict = {"input": queries, "model": embedding_model}
+    if embedding_dimensions:
+        embed_kwargs["dimensions"] = embedding_dimensions
+    response = get_openai_client().embeddings.create(**embed_kwargs)
     query_embeddings = [item.embedding for item in response.data]
 
     # ── Retrieve from ChromaDB ──────────────────────────────────────────
-    results = collection.query(
-        query_embeddings=query_embeddings,
-        n_results=min(n_results, doc_count),
-        include=["documents", "distances"],
-    )
+    # Fan the per-query HNSW searches out across threads — hnswlib releases
+    # the GIL during search, so multi-query wall time approaches the slowest
+    # single query instead of their sum.
+    k = min(n_results, doc_count)
+    if len(query_embeddings) > 1:
+        with ThreadPoolExecutor(max_workers=len(query_embeddings)) as ex:
+            per_query = list(
+                ex.map(
+                    lambda qe: collection.query(
+                        query_embeddings=[qe],
+                        n_results=k,
+                        include=["documents", "distances"],
+                    ),
+                    query_embeddings,
+                )
+            )
+        documents_lists: list[list[str]] = [r["documents"][0] for r in per_query]
+        distances_lists: list[list[float]] = [r["distances"][0] for r in per_query]
+    else:
+        results = collection.query(
+            query_embeddings=query_embeddings,
+            n_results=k,
+            include=["documents", "distances"],
+        )
+        documents_lists = results.get("documents", [])  # type: ignore[assignment]
+        distances_lists = results.get("distances", [])  # type: ignore[assignment]
 
     # ── Deduplicate and collect chunks ──────────────────────────────────
-    seen: set[str] = set()
+    # Key the seen-set on 64-bit digests rather than full chunk strings
+    seen: set[int] = set()
     chunks: list[str] = []
 
-    documents_lists: list[list[str]] = results.get("documents", [])  # type: ignore[assignment]
-    distances_lists: list[list[float]] = results.get("distances", [])  # type: ignore[assignment]
-
     for query_idx, (docs, dists) in enumerate(zip(documents_lists, distances_lists)):
         for doc, dist in zip(docs, dists):
-            if doc not in seen:
-                seen.add(doc)
+            h = _hash_doc(doc)
+            if h not in seen:
+                seen.add(h)
                 chunks.append(doc)
                 logger.debug(
                     "Query {qi} | distance={dist:.4f} | chunk preview: {preview}",
@@ -111,3 +139,27 @@ def retrieve_policy_text(
         q=len(queries),
     )
     return chunks
+
+
+async def retrieve_policy_text_async(
+    queries: list[str],
+    chroma_persist_dir: str,
+    collection_name: str,
+    embedding_model: str,
+    n_results: int = 5,
+    embedding_dimensions: int | None = None,
+) -> list[str]:
+    """Async variant of :func:`retrieve_policy_text` for use inside endpoints.
+
+    Runs the blocking embed + HNSW query in a worker thread so concurrent
+    requests don't serialize on the event loop.
+    """
+    return await asyncio.to_thread(
+        retrieve_policy_text,
+        queries,
+        chroma_persist_dir,
+        collection_name,
+        embedding_model,
+        n_results,
+        embedding_dimensions,
+    )
@@ -2,15 +2,45 @@
 
 from __future__ import annotations
 
-from datetime import date
-from pathlib import Path
+import csv
+import os
+from datetime import date, datetime
+from functools import lru_cache
+from typing import NamedTuple
 
-import pandas as pd
 from loguru import logger
 
 from claim_agent.schemas.claim import ClaimInfo
 
 
+class CoverageRecord(NamedTuple):
+    """One policy's coverage window and dues status."""
+
+    start: date
+    end: date
+    dues_remaining: bool
+
+
+@lru_cache(maxsize=1)
+def _load_coverage(csv_path: str, mtime: float) -> dict[str, CoverageRecord]:
+    """Load the coverage CSV once into a dict keyed by ``policy_number``.
+
+    Validation only needs a hash lookup and two date comparisons, so a plain
+    dict of records beats a DataFrame here.  Keyed on ``(path, mtime)`` so an
+    edited CSV is picked up automatically while repeat claims skip the parse.
+    """
+    records: dict[str, CoverageRecord] = {}
+    with open(csv_path, newline="") as fh:
+        for row in csv.DictReader(fh):
+            records[row["policy_number"]] = CoverageRecord(
+                start=_parse_date(row["coverage_start_date"]),
+                end=_parse_date(row["coverage_end_date"]),
+                dues_remaining=row["premium_dues_remaining"].strip().lower() == "true",
+            )
+    logger.debug("Loaded coverage data — {n} policies", n=len(records))
+    return records
+
+
 def validate_claim(claim: ClaimInfo, csv_path: str) -> tuple[bool, str]:
     """Validate a claim against the policy records CSV.
 
@@ -32,31 +62,51 @@ def validate_claim(claim: ClaimInfo, csv_path: str) -> tuple[bool, str]:
         ``(is_valid, reason)`` — *reason* is ``"valid"`` on success or a
         descriptive failure message.
     """
-    csv_file = Path(csv_path)
-    if not csv_file.exists():
+    # getmtime doubles as the existence check — one stat() instead of a
+    # separate exists() probe before every (usually cached) load
+    try:
+        records = _load_coverage(csv_path, os.path.getmtime(csv_path))
+    except OSError:
         msg = f"Coverage data file not found: {csv_path}"
         logger.error(msg)
         return False, msg
 
-    df = pd.read_csv(csv_file)
-    logger.debug(
-        "Loaded coverage data — {n} policies",
-        n=len(df),
-    )
+    return _check_claim(claim, records)
+
+
+def validate_claims_batch(claims: list[ClaimInfo], csv_path: str) -> list[tuple[bool, str]]:
+    """Validate several claims against the policy records CSV.
+
+    Same checks as :func:`validate_claim`, but the file stat and record
+    lookup table are resolved once for the whole batch instead of once per
+    claim.
 
+    Returns
+    -------
+    list[tuple[bool, str]]
+        One ``(is_valid, reason)`` pair per claim, in input order.
+    """
+    try:
+        records = _load_coverage(csv_path, os.path.getmtime(csv_path))
+    except OSError:
+        msg = f"Coverage data file not found: {csv_path}"
+        logger.error(msg)
+        return [(False, msg)] * len(claims)
+
+    return [_check_claim(claim, records) for claim in claims]
+
+
+def _check_claim(claim: ClaimInfo, records: dict[str, CoverageRecord]) -> tuple[bool, str]:
+    """Run the three per-claim checks against an already-loaded record table."""
     # ── 1. Policy exists ────────────────────────────────────────────────
-    policy_row = df[df["policy_number"] == claim.policy_number]
-    if policy_row.empty:
+    record = records.get(claim.policy_number)
+    if record is None:
         msg = f"Policy {claim.policy_number} not found in records"
         logger.warning(msg, claim_number=claim.claim_number)
         return False, msg
 
-    record = policy_row.iloc[0]
-
     # ── 2. No outstanding premium dues ──────────────────────────────────
-    # CSV stores the value as a string "True"/"False"; coerce to bool.
-    dues_remaining = str(record["premium_dues_remaining"]).strip().lower() == "true"
-    if dues_remaining:
+    if record.dues_remaining:
         msg = (
             f"Policy {claim.policy_number} has outstanding premium dues — claim cannot be processed"
         )
@@ -64,13 +114,10 @@ def validate_claim(claim: ClaimInfo, csv_path: str) -> tuple[bool, str]:
         return False, msg
 
     # ── 3. Date of loss within coverage period ──────────────────────────
-    coverage_start = _parse_date(record["coverage_start_date"])
-    coverage_end = _parse_date(record["coverage_end_date"])
-
-    if not (coverage_start <= claim.date_of_loss <= coverage_end):
+    if not (record.start <= claim.date_of_loss <= record.end):
         msg = (
             f"Date of loss {claim.date_of_loss} is outside the coverage period "
-            f"({coverage_start} to {coverage_end}) for policy {claim.policy_number}"
+            f"({record.start} to {record.end}) for policy {claim.policy_number}"
         )
         logger.warning(msg, claim_number=claim.claim_number)
         return False, msg
@@ -89,8 +136,10 @@ def validate_claim(claim: ClaimInfo, csv_path: str) -> tuple[bool, str]:
 # ---------------------------------------------------------------------------
 
 
-def _parse_date(value: str | date) -> date:
-    """Coerce a string or date value to ``datetime.date``."""
+def _parse_date(value: str | date | datetime) -> date:
+    """Coerce a string, datetime, or date value to ``datetime.date``."""
+    if isinstance(value, datetime):
+        return value.date()
     if isinstance(value, date):
         return value
     return date.fromisoformat(str(value).strip())
@@ -20,12 +20,23 @@ if TYPE_CHECKING:
 class _InterceptHandler(logging.Handler):
     """Route standard-library log records through loguru."""
 
+    # Memoized stdlib levelname → loguru level; resolving via logger.level()
+    # on every record is wasted work on hot paths (httpx, uvicorn access logs)
+    _LEVEL_CACHE: dict[str, str | int] = {}
+
     def emit(self, record: logging.LogRecord) -> None:
         # Find the loguru level that matches the stdlib level.
-        try:
-            level = logger.level(record.levelname).name
-        except ValueError:
-            level = record.levelno  # type: ignore[assignment]
+        level = self._LEVEL_CACHE.get(record.levelname)
+        if level is None:
+            try:
+                level = logger.level(record.levelname).name
+            except ValueError:
+                level = record.levelno
+            self._LEVEL_CACHE[record.levelname] = level
+
+        # Skip the frame walk entirely for records below every sink's level.
+        if record.levelno < logger._core.min_level:  # type: ignore[attr-defined]
+            return
 
         # Find the caller frame so loguru reports the correct source location.
         frame, depth = logging.currentframe(), 2
@@ -17,6 +17,7 @@ from pathlib import Path
 import hydra
 import uvicorn
 from dotenv import load_dotenv
+from fastapi import FastAPI
 from loguru import logger
 from omegaconf import DictConfig, open_dict
 
@@ -25,52 +26,85 @@ from claim_agent.api.app import create_app
 # Load .env BEFORE Hydra resolves ${oc.env:...} references
 load_dotenv()
 
+# Hydra CLI overrides handed to worker processes in multi-worker mode — each
+# worker rebuilds the config via the Compose API inside ``app_factory``.
+_OVERRIDES_ENV = "CLAIM_AGENT_OVERRIDES"
 
-def _resolve_data_paths(cfg: DictConfig) -> None:
-    """Convert relative data paths to absolute using the original working dir.
+
+def _resolve_data_paths(cfg: DictConfig, root: Path) -> None:
+    """Convert relative data paths to absolute, anchored at *root*.
 
     Hydra changes the CWD to ``outputs/<date>/<time>/``.  All relative paths
     in ``cfg.data`` must be anchored to the project root so downstream code
     (ingestion, validation, retrieval) finds the files regardless of CWD.
     """
-    original_cwd = Path(hydra.utils.get_original_cwd())
-
     with open_dict(cfg):
         for key in ("coverage_csv", "policy_pdf", "chroma_persist_dir"):
             raw = cfg.data[key]
             resolved = Path(raw)
             if not resolved.is_absolute():
-                cfg.data[key] = str(original_cwd / resolved)
+                cfg.data[key] = str(root / resolved)
+
+
+def app_factory() -> FastAPI:
+    """Uvicorn factory target — rebuilds config and app in each worker process."""
+    overrides = [o for o in os.environ.get(_OVERRIDES_ENV, "").split() if o]
+    with hydra.initialize(version_base=None, config_path="../../conf"):
+        cfg = hydra.compose(config_name="config", overrides=overrides)
+    _resolve_data_paths(cfg, Path.cwd())
+    return create_app(cfg)
 
 
 @hydra.main(version_base=None, config_path="../../conf", config_name="config")
 def main(cfg: DictConfig) -> None:
     """Bootstrap the application from Hydra config and run uvicorn."""
     # Fix Hydra CWD issue: make data paths absolute
-    _resolve_data_paths(cfg)
+    _resolve_data_paths(cfg, Path(hydra.utils.get_original_cwd()))
 
     # Change back to project root so uvicorn / other libs behave normally
     os.chdir(hydra.utils.get_original_cwd())
 
-    app = create_app(cfg)
-
     host: str = cfg.server.host
     port: int = cfg.server.port
     debug: bool = cfg.server.debug
+    # Reload/debug mode requires a single in-process app
+    workers: int = 1 if debug else int(cfg.server.get("workers", 1))
 
     logger.info(
-        "Starting server on {host}:{port} (debug={debug})",
+        "Starting server on {host}:{port} (debug={debug}, workers={workers})",
         host=host,
         port=port,
         debug=debug,
+        workers=workers,
     )
 
-    uvicorn.run(
-        app,
-        host=host,
-        port=port,
-        log_level="debug" if debug else "info",
-    )
+    # uvloop + httptools ship with uvicorn[standard]; being explicit avoids
+    # silently falling back to the slower asyncio/h11 stack.
+    if workers > 1:
+        # Worker processes import the app via the factory; pass CLI overrides
+        # through the environment so each worker composes the same config.
+        from hydra.core.hydra_config import HydraConfig
+
+        os.environ[_OVERRIDES_ENV] = " ".join(HydraConfig.get().overrides.task)
+        uvicorn.run(
+            "claim_agent.main:app_factory",
+            factory=True,
+            host=host,
+            port=port,
+            workers=workers,
+            loop="uvloop",
+            http="httptools",
+            log_level="info",
+        )
+    else:
+        uvicorn.run(
+            create_app(cfg),
+            host=host,
+            port=port,
+            loop="uvloop",
+            http="httptools",
+            log_level="debug" if debug else "info",
+        )
 
 
 if __name__ == "__main__":
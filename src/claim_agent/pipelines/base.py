@@ -36,3 +36,11 @@ class BasePipeline(ABC):
             The final coverage decision.
         """
         ...
+
+    def process_claims(self, claims: list[ClaimInfo]) -> list[ClaimDecision]:
+        """Process several claims; sequential by default.
+
+        Subclasses with a batch-capable runtime should override this with a
+        concurrent implementation.
+        """
+        return [self.process_claim(claim) for claim in claims]
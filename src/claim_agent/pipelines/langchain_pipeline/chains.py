@@ -10,32 +10,43 @@ Graph topology::
       ▼
     validate_claim ──(invalid)──► finalize_invalid ──► END
       │ (valid)
+      ├────────────┬
+      ▼            ▼
+    check_policy  price_check        (parallel — no shared data dependency)
+      └────────────┴
       ▼
-    check_policy
-      │
-      ▼
-    price_check ──(inflated)──► finalize_inflated ──► END
+    join_checks ──(inflated)──► finalize_inflated ──► END
       │ (ok)
       ▼
     generate_recommendation
       │
       ▼
     finalize_decision ──► END
+
+``check_policy`` (ChromaDB + LLM) and ``price_check`` (web search) run as
+concurrent branches — LangGraph executes same-superstep nodes in parallel —
+so their wall time is max() rather than the sum.
 """
 
 from __future__ import annotations
 
+import operator
 import time
-from typing import Any, TypedDict
+from functools import partial
+from typing import Annotated, Any, TypedDict
 
+from langchain_core.runnables import Runnable
 from langchain_openai import ChatOpenAI
 from langgraph.graph import END, StateGraph
 from loguru import logger
 from omegaconf import DictConfig
 
 from claim_agent.pipelines.langchain_pipeline.tools import (
+    build_query_chain,
+    build_recommendation_chain,
     generate_policy_queries,
     generate_recommendation,
+    match_fast_path_queries,
     parse_claim,
     retrieve_policy_text_tool,
     validate_claim_tool,
@@ -77,8 +88,9 @@ class ClaimState(TypedDict, total=False):
     # Final output
     decision: ClaimDecision
 
-    # Trace / observability
-    trace: list[dict[str, Any]]
+    # Trace / observability — reduced with operator.add so concurrent branches
+    # append entries instead of clobbering each other's lists
+    trace: Annotated[list[dict[str, Any]], operator.add]
 
 
 # ---------------------------------------------------------------------------
@@ -89,79 +101,105 @@ class ClaimState(TypedDict, total=False):
 def _log_node(name: str) -> dict[str, Any]:
     """Return a trace entry dict and log entry into a node."""
     logger.info("── Entering node: {name} ──", name=name)
-    return {"node": name, "entered_at": time.time()}
+    return {"node": name, "entered_at": time.perf_counter()}
 
 
 def node_parse_claim(state: ClaimState) -> dict:
     t = _log_node("parse_claim")
-    claim = parse_claim(state["claim_data"])
-    t["elapsed"] = time.time() - t["entered_at"]
-    trace = state.get("trace", [])
-    trace.append(t)
-    return {"claim": claim, "trace": trace}
-
-
-def node_validate_claim(state: ClaimState, cfg: DictConfig) -> dict:
+    if "claim" in state:
+        # Already a validated ClaimInfo (pipeline entry point) — skip the
+        # serialize→re-validate round trip
+        claim = state["claim"]
+        t["pre_parsed"] = True
+    else:
+        claim = parse_claim(state["claim_data"])
+    t["elapsed"] = time.perf_counter() - t["entered_at"]
+    return {"claim": claim, "trace": [t]}
+
+
+def node_validate_claim(state: ClaimState, *, cfg: DictConfig) -> dict:
     t = _log_node("validate_claim")
     is_valid, reason = validate_claim_tool(state["claim"], cfg.data.coverage_csv)
     t["is_valid"] = is_valid
     t["reason"] = reason
-    t["elapsed"] = time.time() - t["entered_at"]
-    trace = state.get("trace", [])
-    trace.append(t)
-    return {"is_valid": is_valid, "validation_reason": reason, "trace": trace}
+    t["elapsed"] = time.perf_counter() - t["entered_at"]
+    return {"is_valid": is_valid, "validation_reason": reason, "trace": [t]}
 
 
-def node_check_policy(state: ClaimState, cfg: DictConfig, llm: ChatOpenAI) -> dict:
+def node_check_policy(state: ClaimState, *, cfg: DictConfig, query_chain: Runnable) -> dict:
     t = _log_node("check_policy")
 
-    # Generate queries
-    pq = generate_policy_queries(state["claim"], llm)
+    # Known loss types skip the query-generation LLM call
+    canned = match_fast_path_queries(state["claim"].loss_description)
+    if canned is not None:
+        pq = PolicyQueries(queries=canned)
+        t["fast_path"] = True
+    else:
+        pq = generate_policy_queries(state["claim"], query_chain)
     t["queries"] = pq.queries
 
     # Retrieve policy text
     chunks = retrieve_policy_text_tool(pq.queries, cfg)
     t["chunks_retrieved"] = len(chunks)
-    t["elapsed"] = time.time() - t["entered_at"]
-    trace = state.get("trace", [])
-    trace.append(t)
-    return {"policy_queries": pq, "policy_text": chunks, "trace": trace}
+    t["elapsed"] = time.perf_counter() - t["entered_at"]
+    return {"policy_queries": pq, "policy_text": chunks, "trace": [t]}
 
 
-def node_price_check(state: ClaimState, cfg: DictConfig) -> dict:
+def node_price_check(state: ClaimState, *, cfg: DictConfig) -> dict:
     t = _log_node("price_check")
+    claim: ClaimInfo = state["claim"]
+
+    # Small claims aren't worth a 1-3s web round-trip — inflation detection
+    # on a sub-$500 repair is noise either way
+    skip_below = cfg.pipeline.price_check.get("skip_below", 0.0)
+    if claim.estimated_repair_cost < skip_below:
+        logger.info(
+            "Claim {num} below price-check threshold (${cost:,.2f} < ${floor:,.2f}) — skipping",
+            num=claim.claim_number,
+            cost=claim.estimated_repair_cost,
+            floor=skip_below,
+        )
+        t["skipped"] = True
+        t["elapsed"] = time.perf_counter() - t["entered_at"]
+        return {
+            "market_cost_estimate": None,
+            "is_inflated": False,
+            "market_cost_info": "Claim below price-check threshold; skipped.",
+            "trace": [t],
+        }
+
     threshold = cfg.pipeline.price_check.inflation_threshold
     market_est, is_inflated, info = web_search_repair_cost(
-        state["claim"],
+        claim,
         inflation_threshold=threshold,
+        n_queries=cfg.pipeline.price_check.get("n_queries", 3),
     )
     t["market_estimate"] = market_est
     t["is_inflated"] = is_inflated
-    t["elapsed"] = time.time() - t["entered_at"]
-    trace = state.get("trace", [])
-    trace.append(t)
+    t["elapsed"] = time.perf_counter() - t["entered_at"]
     return {
         "market_cost_estimate": market_est,
         "is_inflated": is_inflated,
         "market_cost_info": info,
-        "trace": trace,
+        "trace": [t],
     }
 
 
-def node_generate_recommendation(state: ClaimState, llm: ChatOpenAI) -> dict:
+def node_generate_recommendation(state: ClaimState, *, reco_chain: Runnable) -> dict:
     t = _log_node("generate_recommendation")
-    policy_text_combined = "\n\n---\n\n".join(state.get("policy_text", []))
+    # Dedupe defensively — retrieval already dedupes across queries, but
+    # repeated chunks from any other source would inflate prompt tokens on
+    # the most expensive LLM call in the graph
+    policy_text_combined = "\n\n---\n\n".join(dict.fromkeys(state.get("policy_text", [])))
     rec = generate_recommendation(
         claim=state["claim"],
         policy_text=policy_text_combined or "No policy text available.",
         market_cost_info=state.get("market_cost_info", "No market cost data."),
-        llm=llm,
+        chain=reco_chain,
     )
     t["recommendation"] = rec.recommendation_summary
-    t["elapsed"] = time.time() - t["entered_at"]
-    trace = state.get("trace", [])
-    trace.append(t)
-    return {"recommendation": rec, "trace": trace}
+    t["elapsed"] = time.perf_counter() - t["entered_at"]
+    return {"recommendation": rec, "trace": [t]}
 
 
 def node_finalize_decision(state: ClaimState) -> dict:
@@ -175,15 +213,13 @@ def node_finalize_decision(state: ClaimState) -> dict:
         recommended_payout=rec.settlement_amount or 0.0,
         notes=rec.recommendation_summary,
     )
-    t["elapsed"] = time.time() - t["entered_at"]
-    trace = state.get("trace", [])
-    trace.append(t)
+    t["elapsed"] = time.perf_counter() - t["entered_at"]
     logger.info(
         "✓ Claim {num} APPROVED — payout ${pay:,.2f}",
         num=claim.claim_number,
         pay=decision.recommended_payout,
     )
-    return {"decision": decision, "trace": trace}
+    return {"decision": decision, "trace": [t]}
 
 
 def node_finalize_invalid(state: ClaimState) -> dict:
@@ -196,15 +232,13 @@ def node_finalize_invalid(state: ClaimState) -> dict:
         recommended_payout=0.0,
         notes=f"Claim rejected — {state['validation_reason']}",
     )
-    t["elapsed"] = time.time() - t["entered_at"]
-    trace = state.get("trace", [])
-    trace.append(t)
+    t["elapsed"] = time.perf_counter() - t["entered_at"]
     logger.info(
         "✗ Claim {num} REJECTED — {reason}",
         num=claim.claim_number,
         reason=state["validation_reason"],
     )
-    return {"decision": decision, "trace": trace}
+    return {"decision": decision, "trace": [t]}
 
 
 def node_finalize_inflated(state: ClaimState) -> dict:
@@ -220,11 +254,9 @@ def node_finalize_inflated(state: ClaimState) -> dict:
             f"{state.get('market_cost_info', '')}"
         ),
     )
-    t["elapsed"] = time.time() - t["entered_at"]
-    trace = state.get("trace", [])
-    trace.append(t)
+    t["elapsed"] = time.perf_counter() - t["entered_at"]
     logger.info("✗ Claim {num} REJECTED — inflated cost", num=claim.claim_number)
-    return {"decision": decision, "trace": trace}
+    return {"decision": decision, "trace": [t]}
 
 
 # ---------------------------------------------------------------------------
@@ -232,9 +264,14 @@ def node_finalize_inflated(state: ClaimState) -> dict:
 # ---------------------------------------------------------------------------
 
 
-def route_after_validate(state: ClaimState) -> str:
-    """Route to ``check_policy`` if valid, else ``finalize_invalid``."""
-    return "check_policy" if state.get("is_valid") else "finalize_invalid"
+def node_join_checks(state: ClaimState) -> dict:
+    """Barrier node — waits for both parallel branches before routing."""
+    return {}
+
+
+def route_after_validate(state: ClaimState) -> str | list[str]:
+    """Fan out to both check branches if valid, else ``finalize_invalid``."""
+    return ["check_policy", "price_check"] if state.get("is_valid") else "finalize_invalid"
 
 
 def route_after_price_check(state: ClaimState) -> str:
@@ -265,12 +302,20 @@ def build_claim_graph(cfg: DictConfig, llm: ChatOpenAI) -> StateGraph:
     """
     graph = StateGraph(ClaimState)
 
-    # ── Register nodes (bind cfg / llm via closures) ────────────────────
+    # Build the structured-output chains once — the JSON-schema compilation in
+    # with_structured_output shouldn't be repeated per claim
+    query_chain = build_query_chain(llm)
+    reco_chain = build_recommendation_chain(llm)
+
+    # ── Register nodes (bind cfg / chains via picklable partials) ───────
     graph.add_node("parse_claim", node_parse_claim)
-    graph.add_node("validate_claim", lambda s: node_validate_claim(s, cfg))
-    graph.add_node("check_policy", lambda s: node_check_policy(s, cfg, llm))
-    graph.add_node("price_check", lambda s: node_price_check(s, cfg))
-    graph.add_node("generate_recommendation", lambda s: node_generate_recommendation(s, llm))
+    graph.add_node("validate_claim", partial(node_validate_claim, cfg=cfg))
+    graph.add_node("check_policy", partial(node_check_policy, cfg=cfg, query_chain=query_chain))
+    graph.add_node("price_check", partial(node_price_check, cfg=cfg))
+    graph.add_node(
+        "generate_recommendation", partial(node_generate_recommendation, reco_chain=reco_chain)
+    )
+    graph.add_node("join_checks", node_join_checks)
     graph.add_node("finalize_decision", node_finalize_decision)
     graph.add_node("finalize_invalid", node_finalize_invalid)
     graph.add_node("finalize_inflated", node_finalize_inflated)
@@ -279,16 +324,23 @@ def build_claim_graph(cfg: DictConfig, llm: ChatOpenAI) -> StateGraph:
     graph.set_entry_point("parse_claim")
     graph.add_edge("parse_claim", "validate_claim")
 
+    # Valid claims fan out to both independent checks in one superstep
     graph.add_conditional_edges(
         "validate_claim",
         route_after_validate,
-        {"check_policy": "check_policy", "finalize_invalid": "finalize_invalid"},
+        {
+            "check_policy": "check_policy",
+            "price_check": "price_check",
+            "finalize_invalid": "finalize_invalid",
+        },
     )
 
-    graph.add_edge("check_policy", "price_check")
+    # Join: generate_recommendation needs policy text AND price info, and the
+    # inflation verdict can only be routed once price_check has finished
+    graph.add_edge(["check_policy", "price_check"], "join_checks")
 
     graph.add_conditional_edges(
-        "price_check",
+        "join_checks",
         route_after_price_check,
         {
             "generate_recommendation": "generate_recommendation",
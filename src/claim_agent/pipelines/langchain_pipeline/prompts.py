@@ -1,28 +1,36 @@
-"""Prompt templates for the LangChain / LangGraph pipeline."""
+"""Prompt templates for the LangChain / LangGraph pipeline.
 
-from langchain_core.prompts import ChatPromptTemplate
+System messages carry no template variables, so they are built as static
+``SystemMessage`` objects — LangChain passes pre-built messages through
+untouched and only formats the human template per invocation.
+"""
+
+from langchain_core.messages import SystemMessage
+from langchain_core.prompts import ChatPromptTemplate, HumanMessagePromptTemplate
 
 # ---------------------------------------------------------------------------
 # Query Generation — produce 3-5 targeted policy search queries
 # ---------------------------------------------------------------------------
 
+_QUERY_SYSTEM = SystemMessage(
+    content=(
+        "You are an expert insurance claims analyst. Given a claim's details, "
+        "generate 3 to 5 targeted search queries that would help locate the most "
+        "relevant sections of an auto insurance policy document.\n\n"
+        "Focus on:\n"
+        "- The type of coverage applicable (collision, comprehensive, liability, etc.)\n"
+        "- Deductible and limit clauses\n"
+        "- Exclusions or endorsements that might apply\n"
+        "- Conditions for claim validity\n\n"
+        "Return your answer as a JSON object with a single key 'queries' "
+        "containing a list of query strings."
+    )
+)
+
 QUERY_GENERATION_PROMPT = ChatPromptTemplate.from_messages(
     [
-        (
-            "system",
-            "You are an expert insurance claims analyst. Given a claim's details, "
-            "generate 3 to 5 targeted search queries that would help locate the most "
-            "relevant sections of an auto insurance policy document.\n\n"
-            "Focus on:\n"
-            "- The type of coverage applicable (collision, comprehensive, liability, etc.)\n"
-            "- Deductible and limit clauses\n"
-            "- Exclusions or endorsements that might apply\n"
-            "- Conditions for claim validity\n\n"
-            "Return your answer as a JSON object with a single key 'queries' "
-            "containing a list of query strings.",
-        ),
-        (
-            "human",
+        _QUERY_SYSTEM,
+        HumanMessagePromptTemplate.from_template(
             "Claim details:\n"
             "- Claim Number: {claim_number}\n"
             "- Policy Number: {policy_number}\n"
@@ -30,7 +38,7 @@ QUERY_GENERATION_PROMPT = ChatPromptTemplate.from_messages(
             "- Loss Description: {loss_description}\n"
             "- Estimated Repair Cost: ${estimated_repair_cost:,.2f}\n"
             "- Vehicle: {vehicle_details}\n\n"
-            "Generate the search queries now.",
+            "Generate the search queries now."
         ),
     ]
 )
@@ -39,23 +47,25 @@ QUERY_GENERATION_PROMPT = ChatPromptTemplate.from_messages(
 # Coverage Recommendation — determine coverage, deductible, payout
 # ---------------------------------------------------------------------------
 
+_RECO_SYSTEM = SystemMessage(
+    content=(
+        "You are a senior insurance underwriter. Based on the claim details, "
+        "the relevant policy text retrieved from the insurance document, and the "
+        "market repair cost estimate, determine:\n\n"
+        "1. Whether the collision/loss is covered under the policy.\n"
+        "2. The applicable policy section.\n"
+        "3. The deductible amount (if any).\n"
+        "4. The recommended settlement amount.\n\n"
+        "Provide a concise recommendation summary explaining your reasoning.\n\n"
+        "Return your answer as a JSON object with keys: "
+        "'policy_section', 'recommendation_summary', 'deductible', 'settlement_amount'."
+    )
+)
+
 RECOMMENDATION_PROMPT = ChatPromptTemplate.from_messages(
     [
-        (
-            "system",
-            "You are a senior insurance underwriter. Based on the claim details, "
-            "the relevant policy text retrieved from the insurance document, and the "
-            "market repair cost estimate, determine:\n\n"
-            "1. Whether the collision/loss is covered under the policy.\n"
-            "2. The applicable policy section.\n"
-            "3. The deductible amount (if any).\n"
-            "4. The recommended settlement amount.\n\n"
-            "Provide a concise recommendation summary explaining your reasoning.\n\n"
-            "Return your answer as a JSON object with keys: "
-            "'policy_section', 'recommendation_summary', 'deductible', 'settlement_amount'.",
-        ),
-        (
-            "human",
+        _RECO_SYSTEM,
+        HumanMessagePromptTemplate.from_template(
             "== CLAIM DETAILS ==\n"
             "Claim Number: {claim_number}\n"
             "Policy Number: {policy_number}\n"
@@ -67,7 +77,7 @@ RECOMMENDATION_PROMPT = ChatPromptTemplate.from_messages(
             "{policy_text}\n\n"
             "== MARKET REPAIR COST ESTIMATE ==\n"
             "{market_cost_info}\n\n"
-            "Provide your coverage recommendation now.",
+            "Provide your coverage recommendation now."
         ),
     ]
 )
@@ -9,9 +9,15 @@ nodes — but they follow the same thin-wrapper pattern.
 from __future__ import annotations
 
 import re
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 from duckduckgo_search import DDGS
+from langchain_core.runnables import Runnable
 from langchain_openai import ChatOpenAI
 from loguru import logger
 
@@ -59,9 +65,63 @@ def validate_claim_tool(claim: ClaimInfo, csv_path: str) -> tuple[bool, str]:
 # ---------------------------------------------------------------------------
 
 
-def generate_policy_queries(claim: ClaimInfo, llm: ChatOpenAI) -> PolicyQueries:
+# Fast path for common loss types: a keyword hit means we already know which
+# policy areas to search, so the query-generation LLM call can be skipped and
+# canned queries fed straight to retrieval (which is itself memoized, making
+# repeat fast-path claims nearly free)
+_FAST_PATH_QUERIES: list[tuple[re.Pattern[str], list[str]]] = [
+    (
+        re.compile(r"\bwindshield|windscreen|glass (?:chip|crack)\b", re.IGNORECASE),
+        [
+            "glass and windshield damage coverage",
+            "comprehensive coverage glass repair deductible",
+        ],
+    ),
+    (
+        re.compile(r"\brear[- ]end(?:ed)?|fender[- ]bender|bumper\b", re.IGNORECASE),
+        [
+            "collision coverage minor accident",
+            "collision deductible and repair payout limits",
+        ],
+    ),
+    (
+        re.compile(r"\bhail|flood|storm|falling (?:tree|object)\b", re.IGNORECASE),
+        [
+            "comprehensive coverage weather damage",
+            "acts of nature exclusions and deductible",
+        ],
+    ),
+    (
+        re.compile(r"\btheft|stolen|break[- ]in|vandal", re.IGNORECASE),
+        [
+            "theft and vandalism coverage",
+            "comprehensive coverage stolen vehicle payout",
+        ],
+    ),
+]
+
+
+def match_fast_path_queries(loss_description: str) -> list[str] | None:
+    """Return canned policy queries if *loss_description* matches a known type."""
+    for pattern, queries in _FAST_PATH_QUERIES:
+        if pattern.search(loss_description):
+            return queries
+    return None
+
+
+def build_query_chain(llm: ChatOpenAI) -> Runnable:
+    """Build the query-generation chain once — ``with_structured_output``
+    compiles a JSON schema from the Pydantic model, which shouldn't be
+    repeated per claim."""
+    # json_schema (OpenAI strict structured outputs) skips the function-calling
+    # detour and the second parse pass that include_raw would add
+    return QUERY_GENERATION_PROMPT | llm.with_structured_output(
+        PolicyQueries, method="json_schema"
+    )
+
+
+def generate_policy_queries(claim: ClaimInfo, chain: Runnable) -> PolicyQueries:
     """Ask the LLM to produce 3–5 targeted policy search queries."""
-    chain = QUERY_GENERATION_PROMPT | llm.with_structured_output(PolicyQueries)
     result: PolicyQueries = chain.invoke(
         {
             "claim_number": claim.claim_number,
@@ -85,19 +145,47 @@ def generate_policy_queries(claim: ClaimInfo, llm: ChatOpenAI) -> PolicyQueries:
 # ---------------------------------------------------------------------------
 
 
+@lru_cache(maxsize=1024)
+def _retrieve_cached(
+    queries: tuple[str, ...],
+    chroma_persist_dir: str,
+    collection_name: str,
+    embedding_model: str,
+    n_results: int,
+    embedding_dimensions: int | None,
+) -> tuple[str, ...]:
+    """Memoized retrieval — LLM-generated queries repeat across similar claims
+    (e.g. "windshield damage coverage"), and the policy corpus only changes on
+    re-ingest, so identical query sets can skip the embed + ANN round-trip."""
+    return tuple(
+        retrieve_policy_text(
+            queries=list(queries),
+            chroma_persist_dir=chroma_persist_dir,
+            collection_name=collection_name,
+            embedding_model=embedding_model,
+            n_results=n_results,
+            embedding_dimensions=embedding_dimensions,
+        )
+    )
+
+
 def retrieve_policy_text_tool(
     queries: list[str],
     cfg: DictConfig,
 ) -> list[str]:
     """Embed *queries* and retrieve relevant policy chunks from ChromaDB."""
-    chunks = retrieve_policy_text(
-        queries=queries,
-        chroma_persist_dir=cfg.data.chroma_persist_dir,
-        collection_name=cfg.vectordb.collection_name,
-        embedding_model=cfg.vectordb.embedding_model,
-        n_results=cfg.vectordb.n_results,
+    # Normalise so trivially-different phrasings ("Collision Coverage " vs
+    # "collision coverage") and query order hit the same cache entry
+    key = tuple(sorted({q.strip().lower() for q in queries if q.strip()}))
+    chunks = _retrieve_cached(
+        key,
+        cfg.data.chroma_persist_dir,
+        cfg.vectordb.collection_name,
+        cfg.vectordb.embedding_model,
+        cfg.vectordb.n_results,
+        cfg.vectordb.get("embedding_dimensions"),
     )
-    return chunks
+    return list(chunks)
 
 
 # ---------------------------------------------------------------------------
@@ -105,48 +193,133 @@ def retrieve_policy_text_tool(
 # ---------------------------------------------------------------------------
 
 
+# TTL cache for market estimates — two claims describing the same damage on
+# the same vehicle should reuse one search. Values are (expires_at, estimate,
+# n_data_points); is_inflated is recomputed per claim since it depends on the
+# claimed amount. Plain dict + lock rather than cachetools to stay stdlib.
+_PRICE_CACHE_TTL = 3600.0
+_PRICE_CACHE_MAX = 512
+_price_cache: dict[tuple[str, str], tuple[float, float, int]] = {}
+_price_cache_lock = threading.Lock()
+
+
+def _price_cache_get(key: tuple[str, str]) -> tuple[float, int] | None:
+    with _price_cache_lock:
+        hit = _price_cache.get(key)
+        if hit is None:
+            return None
+        expires_at, estimate, n_points = hit
+        if time.monotonic() >= expires_at:
+            del _price_cache[key]
+            return None
+        return estimate, n_points
+
+
+def _price_cache_put(key: tuple[str, str], estimate: float, n_points: int) -> None:
+    with _price_cache_lock:
+        if len(_price_cache) >= _PRICE_CACHE_MAX:
+            # Evict the soonest-to-expire entries (oldest insertions)
+            for stale in sorted(_price_cache, key=lambda k: _price_cache[k][0])[
+                : _PRICE_CACHE_MAX // 4
+            ]:
+                del _price_cache[stale]
+        _price_cache[key] = (time.monotonic() + _PRICE_CACHE_TTL, estimate, n_points)
+
+
+_ddgs: DDGS | None = None
+
+
+def _get_ddgs() -> DDGS:
+    """Lazily create and reuse a single DDGS session.
+
+    Constructing ``DDGS()`` per search builds a fresh HTTP client and redoes
+    the TLS handshake every time; a shared session keeps the connection pool
+    warm across claims.
+    """
+    global _ddgs
+    if _ddgs is None:
+        _ddgs = DDGS()
+    return _ddgs
+
+
+def _safe_search(query: str) -> list[dict] | None:
+    """Run one DDG text search, returning ``None`` on failure."""
+    try:
+        return list(_get_ddgs().text(query, max_results=5))
+    except Exception as exc:
+        logger.warning("DuckDuckGo search failed for '{q}': {e}", q=query, e=exc)
+        return None
+
+
 def web_search_repair_cost(
     claim: ClaimInfo,
     inflation_threshold: float = 0.40,
+    n_queries: int = 3,
 ) -> tuple[float | None, bool, str]:
     """Search DuckDuckGo for typical market repair costs.
 
+    Fires up to *n_queries* complementary query variants concurrently and
+    takes the **median** of all extracted dollar amounts — more robust to a
+    single noisy result set, at the wall time of one search.
+
     Returns
     -------
     tuple[float | None, bool, str]
         ``(market_estimate, is_inflated, summary_text)``
     """
-    query = f"average auto repair cost {claim.loss_description} {claim.vehicle_details or ''} USD"
-    logger.info("Web-searching repair costs: {q}", q=query)
-
-    try:
-        with DDGS() as ddgs:
-            results = list(ddgs.text(query, max_results=5))
-    except Exception as exc:
-        logger.warning("DuckDuckGo search failed: {e}", e=exc)
-        return None, False, f"Web search unavailable ({exc}). Price check skipped."
-
-    if not results:
-        return None, False, "No web search results found. Price check skipped."
-
-    # Combine snippet text for the LLM / heuristic
-    snippets = "\n".join(f"- {r.get('title', '')}: {r.get('body', '')}" for r in results)
-
-    # Try to extract dollar amounts from snippets
-    amounts = _extract_dollar_amounts(snippets)
-    if not amounts:
-        summary = (
-            f"Web search returned results but no clear dollar estimates.\nSnippets:\n{snippets}"
+    global _ddgs
+    loss = claim.loss_description
+    vehicle = claim.vehicle_details or ""
+    cache_key = (loss.lower().strip(), vehicle.lower().strip())
+
+    cached = _price_cache_get(cache_key)
+    if cached is not None:
+        market_estimate, n_points = cached
+        logger.info(
+            "Market estimate cache hit for claim {num}: ${est:,.2f}",
+            num=claim.claim_number,
+            est=market_estimate,
         )
-        return None, False, summary
+    else:
+        variants = [
+            f"average auto repair cost {loss} {vehicle} USD",
+            f"body shop estimate {vehicle} {loss}",
+            f"insurance claim {loss} repair cost",
+        ][: max(1, n_queries)]
+        logger.info("Web-searching repair costs ({n} variants): {q}", n=len(variants), q=loss)
+
+        with ThreadPoolExecutor(max_workers=len(variants)) as ex:
+            per_query = list(ex.map(_safe_search, variants))
+
+        if all(r is None for r in per_query):
+            _ddgs = None  # session may be poisoned — recreate on next call
+            return None, False, "Web search unavailable. Price check skipped."
+
+        results = [r for batch in per_query if batch for r in batch]
+        if not results:
+            return None, False, "No web search results found. Price check skipped."
+
+        # Combine snippet text for the LLM / heuristic
+        snippets = "\n".join(f"- {r.get('title', '')}: {r.get('body', '')}" for r in results)
+
+        # Try to extract dollar amounts from snippets
+        amounts = _extract_dollar_amounts(snippets)
+        if not amounts:
+            summary = (
+                f"Web search returned results but no clear dollar estimates.\nSnippets:\n{snippets}"
+            )
+            return None, False, summary
+
+        market_estimate = statistics.median(amounts)
+        n_points = len(amounts)
+        _price_cache_put(cache_key, market_estimate, n_points)
 
-    market_estimate = sum(amounts) / len(amounts)
     threshold_amount = market_estimate * (1 + inflation_threshold)
     is_inflated = claim.estimated_repair_cost > threshold_amount
 
     summary = (
         f"Market estimate: ${market_estimate:,.2f} "
-        f"(based on {len(amounts)} data points). "
+        f"(based on {n_points} data points). "
         f"Claimed: ${claim.estimated_repair_cost:,.2f}. "
         f"Threshold ({int(inflation_threshold * 100)}% above market): "
         f"${threshold_amount:,.2f}. "
@@ -165,14 +338,20 @@ def web_search_repair_cost(
 # ---------------------------------------------------------------------------
 
 
+def build_recommendation_chain(llm: ChatOpenAI) -> Runnable:
+    """Build the recommendation chain once (see :func:`build_query_chain`)."""
+    return RECOMMENDATION_PROMPT | llm.with_structured_output(
+        PolicyRecommendation, method="json_schema"
+    )
+
+
 def generate_recommendation(
     claim: ClaimInfo,
     policy_text: str,
     market_cost_info: str,
-    llm: ChatOpenAI,
+    chain: Runnable,
 ) -> PolicyRecommendation:
     """Ask the LLM for a coverage recommendation given claim + policy + costs."""
-    chain = RECOMMENDATION_PROMPT | llm.with_structured_output(PolicyRecommendation)
     result: PolicyRecommendation = chain.invoke(
         {
             "claim_number": claim.claim_number,
@@ -198,15 +377,20 @@ def generate_recommendation(
 # ---------------------------------------------------------------------------
 
 
+# Compiled once at import — re.findall with a pattern string recompiles
+# (or at least re-checks the regex cache) on every snippet batch
+_DOLLAR_RE = re.compile(r"\$\s?([\d,]+(?:\.\d{1,2})?)")
+
+
 def _extract_dollar_amounts(text: str) -> list[float]:
     """Extract dollar amounts from free text (e.g. ``$1,234.56``)."""
-    pattern = r"\$\s?([\d,]+(?:\.\d{1,2})?)"
-    matches = re.findall(pattern, text)
     amounts: list[float] = []
-    for m in matches:
+    for m in _DOLLAR_RE.findall(text):
         try:
-            amounts.append(float(m.replace(",", "")))
+            amount = float(m.replace(",", ""))
         except ValueError:
             continue
-    # Filter out unreasonable amounts (< $50 or > $200k likely noise)
-    return [a for a in amounts if 50 <= a <= 200_000]
+        # Filter out unreasonable amounts (< $50 or > $200k likely noise)
+        if 50 <= amount <= 200_000:
+            amounts.append(amount)
+    return amounts
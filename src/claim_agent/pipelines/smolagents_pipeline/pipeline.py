@@ -8,13 +8,15 @@ graph edges.
 
 from __future__ import annotations
 
-import json
+import asyncio
+import re
 import time
+from functools import cached_property, lru_cache
 from typing import Any
 
 from loguru import logger
 from omegaconf import DictConfig
-from smolagents import DuckDuckGoSearchTool, OpenAIServerModel, ToolCallingAgent
+from smolagents import OpenAIServerModel, ToolCallingAgent
 
 from claim_agent.pipelines.base import BasePipeline
 from claim_agent.pipelines.smolagents_pipeline.prompts import get_prompt_templates
@@ -25,7 +27,27 @@ from claim_agent.pipelines.smolagents_pipeline.tools import (
     parse_and_validate_claim,
     retrieve_policy_text,
 )
-from claim_agent.schemas.claim import ClaimDecision, ClaimInfo
+from claim_agent.schemas.claim import CLAIM_DECISION_ADAPTER, ClaimDecision, ClaimInfo
+
+# Output-parsing patterns, compiled once at import — the failure path in
+# _parse_decision runs several of these in sequence
+_COVERED_TRUE_RE = re.compile(r'"covered"\s*:\s*true', re.IGNORECASE)
+_COVERED_FALSE_RE = re.compile(r'"covered"\s*:\s*false', re.IGNORECASE)
+_DEDUCTIBLE_RE = re.compile(r'"deductible"\s*:\s*([\d.]+)')
+_PAYOUT_RE = re.compile(r'"recommended_payout"\s*:\s*([\d.]+)')
+_NOTES_RE = re.compile(r'"notes"\s*:\s*"([^"]*)"')
+
+
+@lru_cache(maxsize=256)
+def _validate_decision_json(json_str: str) -> ClaimDecision:
+    """Validate a decision JSON payload, memoized on the exact payload.
+
+    Retries and replayed traces at temperature 0 often repeat the agent's
+    output verbatim; ``ClaimDecision`` is frozen, so sharing the cached
+    instance is safe.  Failures raise and are never cached, so each bad
+    payload still surfaces through the caller's fallback path.
+    """
+    return CLAIM_DECISION_ADAPTER.validate_json(json_str)
 
 
 class SmolAgentsPipeline(BasePipeline):
@@ -60,7 +82,6 @@ class SmolAgentsPipeline(BasePipeline):
             retrieve_policy_text,
             estimate_repair_cost,
             generate_recommendation,
-            DuckDuckGoSearchTool(),
         ]
 
         # ── Prompt templates ─────────────────────────────────────────────
@@ -69,6 +90,26 @@ class SmolAgentsPipeline(BasePipeline):
         # ── Agent config ─────────────────────────────────────────────────
         self.max_steps = cfg.pipeline.agent.max_steps
         self.verbosity = cfg.pipeline.agent.verbosity_level
+        self.autonomous = cfg.pipeline.agent.get("autonomous", True)
+        self.stream = cfg.pipeline.agent.get("stream", False)
+        # None disables periodic planning steps entirely — the workflow is
+        # fixed, so re-planning mid-run only burns extra LLM calls
+        self.planning_interval = cfg.pipeline.agent.get("planning_interval", None)
+
+        # Static portion of the task prompt — identical for every claim, so
+        # the nine OmegaConf resolver lookups happen once, not per claim
+        self._config_block = (
+            f"## Configuration values for tool calls\n"
+            f"- csv_path: {cfg.data.coverage_csv}\n"
+            f"- model_name: {cfg.llm.model}\n"
+            f"- temperature: {cfg.llm.temperature}\n"
+            f"- api_key: {cfg.llm.api_key}\n"
+            f"- chroma_persist_dir: {cfg.data.chroma_persist_dir}\n"
+            f"- collection_name: {cfg.vectordb.collection_name}\n"
+            f"- embedding_model: {cfg.vectordb.embedding_model}\n"
+            f"- n_results: {cfg.vectordb.n_results}\n"
+            f"- inflation_threshold: {cfg.pipeline.price_check.inflation_threshold}\n"
+        )
 
         logger.info("SmolAgentsPipeline ready")
 
@@ -89,12 +130,30 @@ class SmolAgentsPipeline(BasePipeline):
         ClaimDecision
             The final coverage decision.
         """
+        if not self.autonomous:
+            return self.process_claim_fast(claim)
+
         logger.info(
             "Processing claim {num} via Smolagents pipeline",
             num=claim.claim_number,
         )
         start = time.time()
 
+        # Validation is deterministic — reject invalid claims here instead of
+        # paying the agent 2-3 LLM round-trips to reach the same conclusion
+        from claim_agent.core.validation import validate_claim
+
+        is_valid, reason = validate_claim(claim, self.cfg.data.coverage_csv)
+        if not is_valid:
+            logger.info("✗ Claim {num} REJECTED — {r}", num=claim.claim_number, r=reason)
+            return ClaimDecision(
+                claim_number=claim.claim_number,
+                covered=False,
+                deductible=0.0,
+                recommended_payout=0.0,
+                notes=f"Claim rejected — {reason}",
+            )
+
         # Build a fresh agent per invocation (lightweight; avoids stale state)
         agent = ToolCallingAgent(
             tools=self.tools,
@@ -102,14 +161,27 @@ class SmolAgentsPipeline(BasePipeline):
             prompt_templates=self.prompt_templates,
             max_steps=self.max_steps,
             verbosity_level=self.verbosity,
-            planning_interval=2,
+            planning_interval=self.planning_interval,
         )
 
         # Build the task prompt with all config values the tools need
         task = self._build_task_prompt(claim)
 
-        # Run the agent
-        raw_result = agent.run(task)
+        # Run the agent. In streaming mode we consume steps as they are
+        # produced and can stop as soon as a step carries a parseable final
+        # decision, rather than waiting for the run to fully unwind.
+        if self.stream:
+            raw_result: Any = None
+            for step in agent.run(task, stream=True):
+                raw_result = getattr(step, "output", step)
+                if isinstance(raw_result, str):
+                    # A span narrower than the whole step output means a
+                    # wrapped JSON object — i.e. a final decision — arrived
+                    span = self._find_json_span(raw_result)
+                    if span is not None and span != (0, len(raw_result)):
+                        break
+        else:
+            raw_result = agent.run(task)
         elapsed = time.time() - start
 
         logger.info(
@@ -129,28 +201,170 @@ class SmolAgentsPipeline(BasePipeline):
         )
         return decision
 
+    # -----------------------------------------------------------------
+    # Fast path (explicit orchestration, no agent planning steps)
+    # -----------------------------------------------------------------
+
+    @cached_property
+    def _fast_chains(self) -> tuple[Any, Any]:
+        """Lazily build the (query, recommendation) structured-output chains.
+
+        Only constructed when the fast path is used — the agent path never
+        needs a ChatOpenAI instance of its own.
+        """
+        from langchain_openai import ChatOpenAI
+
+        from claim_agent.pipelines.langchain_pipeline.tools import (
+            build_query_chain,
+            build_recommendation_chain,
+        )
+
+        cfg = self.cfg
+        llm_kwargs: dict[str, Any] = {
+            "model": cfg.llm.model,
+            "temperature": cfg.llm.temperature,
+            "api_key": cfg.llm.api_key,
+        }
+        if cfg.llm.get("base_url"):
+            llm_kwargs["base_url"] = cfg.llm.base_url
+        llm = ChatOpenAI(**llm_kwargs)
+        return build_query_chain(llm), build_recommendation_chain(llm)
+
+    def process_claim_fast(self, claim: ClaimInfo) -> ClaimDecision:
+        """Process a claim with explicit orchestration instead of the agent.
+
+        Runs the same workflow as the agent but skips its per-step planning
+        LLM calls and overlaps the two independent I/O steps — policy
+        retrieval (ChromaDB) and the market price check (web search) — so
+        their wall time is max() rather than the sum.
+        """
+        from claim_agent.core.retrieval import retrieve_policy_text
+        from claim_agent.core.validation import validate_claim
+        from claim_agent.pipelines.langchain_pipeline.tools import (
+            generate_policy_queries,
+            generate_recommendation,
+            web_search_repair_cost,
+        )
+
+        cfg = self.cfg
+        logger.info(
+            "Processing claim {num} via Smolagents fast path",
+            num=claim.claim_number,
+        )
+        start = time.time()
+
+        # 1. Validate
+        is_valid, reason = validate_claim(claim, cfg.data.coverage_csv)
+        if not is_valid:
+            logger.info("✗ Claim {num} REJECTED — {r}", num=claim.claim_number, r=reason)
+            return ClaimDecision(
+                claim_number=claim.claim_number,
+                covered=False,
+                deductible=0.0,
+                recommended_payout=0.0,
+                notes=f"Claim rejected — {reason}",
+            )
+
+        # 2. Generate queries, then overlap retrieval and the price check
+        query_chain, reco_chain = self._fast_chains
+        pq = generate_policy_queries(claim, query_chain)
+
+        async def _gather() -> tuple[list[str], tuple[float | None, bool, str]]:
+            retrieve_task = asyncio.to_thread(
+                retrieve_policy_text,
+                queries=pq.queries,
+                chroma_persist_dir=cfg.data.chroma_persist_dir,
+                collection_name=cfg.vectordb.collection_name,
+                embedding_model=cfg.vectordb.embedding_model,
+                n_results=cfg.vectordb.n_results,
+                embedding_dimensions=cfg.vectordb.get("embedding_dimensions"),
+            )
+            price_task = asyncio.to_thread(
+                web_search_repair_cost,
+                claim,
+                inflation_threshold=cfg.pipeline.price_check.inflation_threshold,
+            )
+            return await asyncio.gather(retrieve_task, price_task)
+
+        chunks, (market_est, is_inflated, cost_info) = asyncio.run(_gather())
+
+        if is_inflated:
+            logger.info("✗ Claim {num} REJECTED — inflated cost", num=claim.claim_number)
+            return ClaimDecision(
+                claim_number=claim.claim_number,
+                covered=False,
+                deductible=0.0,
+                recommended_payout=0.0,
+                notes=f"Claim rejected — estimated repair cost appears inflated. {cost_info}",
+            )
+
+        # 3. Recommendation → decision
+        rec = generate_recommendation(
+            claim=claim,
+            policy_text="\n\n---\n\n".join(chunks) or "No policy text available.",
+            market_cost_info=cost_info or "No market cost data.",
+            chain=reco_chain,
+        )
+        decision = ClaimDecision(
+            claim_number=claim.claim_number,
+            covered=True,
+            deductible=rec.deductible or 0.0,
+            recommended_payout=rec.settlement_amount or 0.0,
+            notes=rec.recommendation_summary,
+        )
+        logger.info(
+            "Fast path processed claim {num} in {t:.2f}s — covered={cov}",
+            num=claim.claim_number,
+            t=time.time() - start,
+            cov=decision.covered,
+        )
+        return decision
+
+    def process_claims(self, claims: list[ClaimInfo]) -> list[ClaimDecision]:
+        """Process several claims concurrently.
+
+        Agent runs are synchronous and spend most of their time waiting on
+        LLM and search I/O, so fanning them out across threads overlaps
+        those waits — N claims cost ≈max(t_claim) up to the concurrency cap.
+        """
+        if not claims:
+            return []
+        logger.info("Processing {n} claims as a batch", n=len(claims))
+        start = time.time()
+        decisions = asyncio.run(self.aprocess_claims(claims))
+        logger.info(
+            "Batch of {n} claims processed in {t:.2f}s",
+            n=len(claims),
+            t=time.time() - start,
+        )
+        return decisions
+
+    async def aprocess_claims(self, claims: list[ClaimInfo]) -> list[ClaimDecision]:
+        """Process claims concurrently with a semaphore-bounded thread fan-out."""
+        sem = asyncio.Semaphore(self.cfg.pipeline.agent.get("max_concurrency", 4))
+
+        async def _one(claim: ClaimInfo) -> ClaimDecision:
+            async with sem:
+                return await asyncio.to_thread(self.process_claim, claim)
+
+        return list(await asyncio.gather(*(_one(claim) for claim in claims)))
+
     # -----------------------------------------------------------------
     # Internals
     # -----------------------------------------------------------------
 
     def _build_task_prompt(self, claim: ClaimInfo) -> str:
-        """Construct the task string with claim data and all config values."""
-        claim_json = claim.model_dump_json()
-        cfg = self.cfg
+        """Construct the task string with claim data and all config values.
 
+        The stable parts (intro + config block) lead and the per-claim JSON
+        trails so the prompt shares its longest possible prefix across
+        claims — the system prompt plus this head — which provider-side
+        prompt caching can then reuse batch-wide.
+        """
         return (
             f"Process the following insurance claim.\n\n"
-            f"## Claim JSON\n```json\n{claim_json}\n```\n\n"
-            f"## Configuration values for tool calls\n"
-            f"- csv_path: {cfg.data.coverage_csv}\n"
-            f"- model_name: {cfg.llm.model}\n"
-            f"- temperature: {cfg.llm.temperature}\n"
-            f"- api_key: {cfg.llm.api_key}\n"
-            f"- chroma_persist_dir: {cfg.data.chroma_persist_dir}\n"
-            f"- collection_name: {cfg.vectordb.collection_name}\n"
-            f"- embedding_model: {cfg.vectordb.embedding_model}\n"
-            f"- n_results: {cfg.vectordb.n_results}\n"
-            f"- inflation_threshold: {cfg.pipeline.price_check.inflation_threshold}\n\n"
+            f"{self._config_block}\n"
+            f"## Claim JSON\n```json\n{claim.model_dump_json()}\n```\n\n"
             f"Follow the strict workflow from your system prompt. "
             f"Return the final decision as a JSON object."
         )
@@ -167,15 +381,19 @@ class SmolAgentsPipeline(BasePipeline):
         If the first parse fails and ``_retry`` is True, attempt to extract
         JSON from the raw string and retry once.
         """
-        # If agent returned a string, try to parse as JSON
-        text = str(raw_result)
+        # Agent output is usually already a str — only stringify otherwise,
+        # avoiding a full-text copy of potentially multi-KB transcripts
+        text = raw_result if isinstance(raw_result, str) else str(raw_result)
 
-        # Try to extract JSON from the text (agent may wrap it in markdown)
-        json_str = self._extract_json(text)
+        # Locate the JSON payload (agent may wrap it in markdown); slice
+        # only the span that validate_json needs
+        span = self._find_json_span(text)
+        json_str = text[span[0] : span[1]] if span else text
 
         try:
-            data = json.loads(json_str)
-            return ClaimDecision(**data)
+            # Single pydantic-core pass from JSON straight to the model,
+            # memoized so replayed identical outputs skip re-validation
+            return _validate_decision_json(json_str)
         except Exception as first_err:
             logger.warning(
                 "First parse attempt failed for claim {num}: {err}",
@@ -212,47 +430,77 @@ class SmolAgentsPipeline(BasePipeline):
             )
 
     @staticmethod
-    def _extract_json(text: str) -> str:
-        """Extract the first JSON object from *text* (handles markdown fences)."""
-        import re
-
-        # Try markdown code block first
-        match = re.search(r"```(?:json)?\s*(\{.*?\})\s*```", text, re.DOTALL)
-        if match:
-            return match.group(1)
-
-        # Try bare JSON object
-        match = re.search(r"\{[^{}]*\}", text, re.DOTALL)
-        if match:
-            return match.group(0)
+    def _find_json_span(text: str) -> tuple[int, int] | None:
+        """Locate the first JSON object in *text* as a ``(start, end)`` span.
 
-        return text
+        Returning indices instead of a substring lets callers decide whether
+        a copy is needed at all. Pure ``str.find`` plus one brace-counting
+        pass — O(n), no regex engine involved, and unlike the old
+        ``\\{[^{}]*\\}`` pattern it handles nested objects correctly.
+        """
+        # Fast path: a well-behaved agent returns the bare object and
+        # nothing else, so delimiter checks alone settle it — validation
+        # downstream catches the rare lookalike
+        start = len(text) - len(text.lstrip())
+        end = len(text.rstrip())
+        if end > start and text[start] == "{" and text[end - 1] == "}":
+            return (start, end)
+
+        # Inside a markdown fence, start at the fence so stray braces in any
+        # preceding prose are skipped; otherwise at the first '{'
+        fence = text.find("```")
+        start = text.find("{", fence if fence != -1 else 0)
+        if start != -1:
+            depth = 0
+            in_str = False
+            escaped = False
+            for i in range(start, len(text)):
+                ch = text[i]
+                if escaped:
+                    escaped = False
+                elif ch == "\\":
+                    escaped = True
+                elif ch == '"':
+                    in_str = not in_str
+                elif not in_str:
+                    if ch == "{":
+                        depth += 1
+                    elif ch == "}":
+                        depth -= 1
+                        if depth == 0:
+                            return (start, i + 1)
+
+        return None
+
+    @classmethod
+    def _extract_json(cls, text: str) -> str:
+        """Extract the first JSON object from *text* (handles markdown fences)."""
+        span = cls._find_json_span(text)
+        return text[span[0] : span[1]] if span else text
 
     @staticmethod
     def _fuzzy_extract(text: str, claim: ClaimInfo) -> dict:
         """Best-effort extraction of decision fields from free-form text."""
-        import re
-
         data: dict[str, Any] = {"claim_number": claim.claim_number}
 
         # covered
-        if re.search(r'"covered"\s*:\s*true', text, re.IGNORECASE):
+        if _COVERED_TRUE_RE.search(text):
             data["covered"] = True
-        elif re.search(r'"covered"\s*:\s*false', text, re.IGNORECASE):
+        elif _COVERED_FALSE_RE.search(text):
             data["covered"] = False
         else:
             data["covered"] = False
 
         # deductible
-        ded_match = re.search(r'"deductible"\s*:\s*([\d.]+)', text)
+        ded_match = _DEDUCTIBLE_RE.search(text)
         data["deductible"] = float(ded_match.group(1)) if ded_match else 0.0
 
         # recommended_payout
-        pay_match = re.search(r'"recommended_payout"\s*:\s*([\d.]+)', text)
+        pay_match = _PAYOUT_RE.search(text)
         data["recommended_payout"] = float(pay_match.group(1)) if pay_match else 0.0
 
         # notes
-        notes_match = re.search(r'"notes"\s*:\s*"([^"]*)"', text)
+        notes_match = _NOTES_RE.search(text)
         data["notes"] = (
             notes_match.group(1)
             if notes_match
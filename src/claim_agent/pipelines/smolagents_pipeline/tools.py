@@ -11,8 +11,79 @@ parameters rather than injecting ``DictConfig`` objects.
 
 from __future__ import annotations
 
+import hashlib
+import os
+import re
+import time
+from pathlib import Path
+
+# langchain_openai is imported here only to warm sys.modules: the tool
+# bodies must keep their own local imports (smolagents serializes their
+# source, so they stay self-contained), but with it preloaded the in-body
+# imports are plain dict lookups and the first tool call no longer pays the
+# cold start. Imported as the bare module so the in-body ChatOpenAI imports
+# don't shadow a module-level name. orjson warms those lookups too.
+import langchain_openai  # noqa: F401
+import orjson
 from smolagents import tool
 
+# Process-wide ChatOpenAI cache shared by the LLM-backed tools. Tool bodies
+# reach it via an absolute import (keeping them self-contained for source
+# serialization) so the httpx client and its TCP/TLS connections are reused
+# across tool calls instead of being rebuilt per invocation.
+_LLM_CACHE: dict[tuple, object] = {}
+
+# On-disk memoization for the I/O tools (ChromaDB search, DuckDuckGo search).
+# Content-addressed JSON files with a TTL — repeat queries skip the network
+# round-trip entirely. Tool bodies reach these via absolute import, like
+# ``_LLM_CACHE`` above.
+_TOOL_CACHE_DIR = os.environ.get("CLAIM_AGENT_TOOL_CACHE", "/tmp/claim_agent_cache")
+_TOOL_CACHE_TTL = 24 * 3600.0
+
+
+def _tool_cache_get(key: str) -> str | None:
+    """Return the cached value for *key*, or ``None`` if missing/expired."""
+    path = Path(_TOOL_CACHE_DIR) / f"{hashlib.sha256(key.encode()).hexdigest()}.json"
+    try:
+        entry = orjson.loads(path.read_bytes())
+        if time.time() - entry["ts"] < _TOOL_CACHE_TTL:
+            return entry["value"]
+    except (OSError, ValueError, KeyError):
+        pass
+    return None
+
+
+def _tool_cache_put(key: str, value: str) -> None:
+    """Store *value* under *key*; cache write failures are non-fatal."""
+    try:
+        cache_dir = Path(_TOOL_CACHE_DIR)
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        path = cache_dir / f"{hashlib.sha256(key.encode()).hexdigest()}.json"
+        path.write_bytes(orjson.dumps({"ts": time.time(), "value": value}))
+    except OSError:
+        pass
+
+
+# Compiled once at import; anchored on a leading digit so every match is
+# guaranteed float-parseable after stripping commas
+_DOLLAR_RE = re.compile(r"\$\s?(\d[\d,]*(?:\.\d{1,2})?)")
+
+# Module-wide DuckDuckGo session — DDGS carries an HTTP client, so reusing
+# one instance across tool calls keeps its connections alive instead of
+# re-handshaking per search. Tool bodies reach it via absolute import.
+_ddgs = None
+
+
+def _get_ddgs():
+    """Return the shared DDGS session, creating it on first use."""
+    global _ddgs
+    if _ddgs is None:
+        from duckduckgo_search import DDGS
+
+        _ddgs = DDGS()
+    return _ddgs
+
+
 # ---------------------------------------------------------------------------
 # Tool: parse and validate claim
 # ---------------------------------------------------------------------------
@@ -32,20 +103,20 @@ def parse_and_validate_claim(
     Returns:
         A JSON string with keys 'is_valid' (bool), 'reason' (str), and 'claim' (dict).
     """
-    import json as _json
+    import orjson as _orjson
 
     from claim_agent.core.validation import validate_claim
-    from claim_agent.schemas.claim import ClaimInfo
+    from claim_agent.schemas.claim import CLAIM_INFO_ADAPTER
 
-    data = _json.loads(claim_json)
-    claim = ClaimInfo(**data)
+    # The prebuilt TypeAdapter parses + validates in one pydantic-core
+    # pass, skipping the intermediate Python dict. The input JSON already
+    # validated, so splice it back verbatim rather than re-serializing.
+    claim = CLAIM_INFO_ADAPTER.validate_json(claim_json)
     is_valid, reason = validate_claim(claim, csv_path)
-    return _json.dumps(
-        {
-            "is_valid": is_valid,
-            "reason": reason,
-            "claim": claim.model_dump(mode="json"),
-        }
+    return (
+        f'{{"is_valid": {"true" if is_valid else "false"}, '
+        f'"reason": {_orjson.dumps(reason).decode()}, '
+        f'"claim": {claim_json}}}'
     )
 
 
@@ -72,20 +143,24 @@ def generate_policy_queries(
     Returns:
         A JSON string with key 'queries' containing a list of search query strings.
     """
-    import json as _json
     import os as _os
 
+    import orjson as _orjson
     from langchain_openai import ChatOpenAI
 
     from claim_agent.pipelines.langchain_pipeline.prompts import QUERY_GENERATION_PROMPT
-    from claim_agent.schemas.claim import ClaimInfo
+    from claim_agent.pipelines.smolagents_pipeline.tools import _LLM_CACHE
+    from claim_agent.schemas.claim import CLAIM_INFO_ADAPTER
     from claim_agent.schemas.policy import PolicyQueries
 
-    claim = ClaimInfo(**_json.loads(claim_json))
+    claim = CLAIM_INFO_ADAPTER.validate_json(claim_json)
     llm_kwargs: dict = {"model": model_name, "temperature": temperature, "api_key": api_key}
     if _os.environ.get("OPENAI_BASE_URL"):
         llm_kwargs["base_url"] = _os.environ["OPENAI_BASE_URL"]
-    llm = ChatOpenAI(**llm_kwargs)
+    cache_key = (model_name, temperature, api_key, llm_kwargs.get("base_url"))
+    llm = _LLM_CACHE.get(cache_key)
+    if llm is None:
+        llm = _LLM_CACHE.setdefault(cache_key, ChatOpenAI(**llm_kwargs))
     chain = QUERY_GENERATION_PROMPT | llm.with_structured_output(PolicyQueries)
     result: PolicyQueries = chain.invoke(
         {
@@ -97,7 +172,7 @@ def generate_policy_queries(
             "vehicle_details": claim.vehicle_details or "N/A",
         }
     )
-    return _json.dumps({"queries": result.queries})
+    return _orjson.dumps({"queries": result.queries}).decode()
 
 
 # ---------------------------------------------------------------------------
@@ -125,12 +200,33 @@ def retrieve_policy_text(
     Returns:
         A JSON string with key 'chunks' containing a list of relevant policy text strings.
     """
-    import json as _json
+    import orjson as _orjson
 
     from claim_agent.core.retrieval import retrieve_policy_text as _retrieve
+    from claim_agent.pipelines.smolagents_pipeline.tools import (
+        _tool_cache_get,
+        _tool_cache_put,
+    )
 
-    data = _json.loads(queries_json)
-    queries = data["queries"]
+    # The persist dir is part of the key — the cache path is shared, and the
+    # same collection name can exist in different Chroma stores
+    cache_key = (
+        f"retrieve:{queries_json}:{chroma_persist_dir}:{collection_name}"
+        f":{embedding_model}:{n_results}"
+    )
+    cached = _tool_cache_get(cache_key)
+    if cached is not None:
+        return cached
+
+    data = _orjson.loads(queries_json)
+    # Case-folded dedupe + cap — near-duplicate LLM queries would each cost
+    # an embedding and a Chroma search
+    seen: set[str] = set()
+    queries = [
+        q
+        for q in (s.strip() for s in data["queries"])
+        if q and not (q.casefold() in seen or seen.add(q.casefold()))
+    ][:5]
     chunks = _retrieve(
         queries=queries,
         chroma_persist_dir=chroma_persist_dir,
@@ -138,7 +234,9 @@ def retrieve_policy_text(
         embedding_model=embedding_model,
         n_results=n_results,
     )
-    return _json.dumps({"chunks": chunks})
+    result = _orjson.dumps({"chunks": chunks}).decode()
+    _tool_cache_put(cache_key, result)
+    return result
 
 
 # ---------------------------------------------------------------------------
@@ -162,77 +260,97 @@ def estimate_repair_cost(
         A JSON string with keys 'market_estimate' (float or null),
             'is_inflated' (bool), and 'summary' (str).
     """
-    import json as _json
-    import re as _re
-
-    from duckduckgo_search import DDGS
-
-    from claim_agent.schemas.claim import ClaimInfo
+    import orjson as _orjson
 
-    claim = ClaimInfo(**_json.loads(claim_json))
-    query = f"average auto repair cost {claim.loss_description} {claim.vehicle_details or ''} USD"
-
-    try:
-        with DDGS() as ddgs:
-            results = list(ddgs.text(query, max_results=5))
-    except Exception as exc:
-        return _json.dumps(
-            {
-                "market_estimate": None,
-                "is_inflated": False,
-                "summary": f"Web search unavailable ({exc}). Price check skipped.",
-            }
-        )
-
-    if not results:
-        return _json.dumps(
-            {
-                "market_estimate": None,
-                "is_inflated": False,
-                "summary": "No web search results found. Price check skipped.",
-            }
+    from claim_agent.pipelines.smolagents_pipeline.tools import (
+        _DOLLAR_RE,
+        _get_ddgs,
+        _tool_cache_get,
+        _tool_cache_put,
+    )
+    from claim_agent.schemas.claim import CLAIM_INFO_ADAPTER
+
+    claim = CLAIM_INFO_ADAPTER.validate_json(claim_json)
+
+    # Cache the searched market estimate on the damage description + vehicle;
+    # the inflation verdict is recomputed per claim from the claimed amount
+    cache_key = f"price:{claim.loss_description}:{claim.vehicle_details or ''}"
+    cached = _tool_cache_get(cache_key)
+    if cached is not None:
+        market_estimate, n_points = _orjson.loads(cached)
+    else:
+        query = (
+            f"average auto repair cost {claim.loss_description} "
+            f"{claim.vehicle_details or ''} USD"
         )
 
-    snippets = "\n".join(f"- {r.get('title', '')}: {r.get('body', '')}" for r in results)
-
-    # Extract dollar amounts
-    pattern = r"\$\s?([\d,]+(?:\.\d{1,2})?)"
-    matches = _re.findall(pattern, snippets)
-    amounts: list[float] = []
-    for m in matches:
+        # Stream results and extract dollar amounts as they arrive — the
+        # shared pattern anchors on a digit, so every match parses cleanly.
+        # Once enough price points are in hand, stop consuming the iterator
+        # rather than fetching the remaining results.
+        amounts: list[float] = []
+        snippet_parts: list[str] = []
         try:
-            val = float(m.replace(",", ""))
-            if 50 <= val <= 200_000:
-                amounts.append(val)
-        except ValueError:
-            continue
-
-    if not amounts:
-        return _json.dumps(
-            {
-                "market_estimate": None,
-                "is_inflated": False,
-                "summary": (
-                    f"Web search returned results but no clear dollar estimates.\n"
-                    f"Snippets:\n{snippets}"
-                ),
-            }
-        )
+            for r in _get_ddgs().text(query, max_results=5):
+                text = f"- {r.get('title', '')}: {r.get('body', '')}"
+                snippet_parts.append(text)
+                amounts += [
+                    val
+                    for m in _DOLLAR_RE.findall(text)
+                    if 50 <= (val := float(m.replace(",", ""))) <= 200_000
+                ]
+                if len(amounts) >= 5:
+                    break
+        except Exception as exc:
+            return _orjson.dumps(
+                {
+                    "market_estimate": None,
+                    "is_inflated": False,
+                    "summary": f"Web search unavailable ({exc}). Price check skipped.",
+                }
+            )
+
+        if not snippet_parts:
+            return _orjson.dumps(
+                {
+                    "market_estimate": None,
+                    "is_inflated": False,
+                    "summary": "No web search results found. Price check skipped.",
+                }
+            )
+
+        snippets = "\n".join(snippet_parts)
+
+        if not amounts:
+            return _orjson.dumps(
+                {
+                    "market_estimate": None,
+                    "is_inflated": False,
+                    "summary": (
+                        f"Web search returned results but no clear dollar estimates.\n"
+                        f"Snippets:\n{snippets}"
+                    ),
+                }
+            )
+
+        market_estimate = sum(amounts) / len(amounts)
+        n_points = len(amounts)
+        # decode: the cache stores str values (orjson can't serialize bytes)
+        _tool_cache_put(cache_key, _orjson.dumps([market_estimate, n_points]).decode())
 
-    market_estimate = sum(amounts) / len(amounts)
     threshold_amount = market_estimate * (1 + inflation_threshold)
     is_inflated = claim.estimated_repair_cost > threshold_amount
 
     summary = (
         f"Market estimate: ${market_estimate:,.2f} "
-        f"(based on {len(amounts)} data points). "
+        f"(based on {n_points} data points). "
         f"Claimed: ${claim.estimated_repair_cost:,.2f}. "
         f"Threshold ({int(inflation_threshold * 100)}% above market): "
         f"${threshold_amount:,.2f}. "
         f"{'INFLATED — claimed cost exceeds threshold.' if is_inflated else 'Within acceptable range.'}"  # noqa: E501
     )
 
-    return _json.dumps(
+    return _orjson.dumps(
         {
             "market_estimate": market_estimate,
             "is_inflated": is_inflated,
@@ -270,20 +388,24 @@ def generate_recommendation(
         A JSON string with keys 'policy_section',
             'recommendation_summary', 'deductible', and 'settlement_amount'.
     """
-    import json as _json
     import os as _os
 
+    import orjson as _orjson
     from langchain_openai import ChatOpenAI
 
     from claim_agent.pipelines.langchain_pipeline.prompts import RECOMMENDATION_PROMPT
-    from claim_agent.schemas.claim import ClaimInfo
+    from claim_agent.pipelines.smolagents_pipeline.tools import _LLM_CACHE
+    from claim_agent.schemas.claim import CLAIM_INFO_ADAPTER
     from claim_agent.schemas.policy import PolicyRecommendation
 
-    claim = ClaimInfo(**_json.loads(claim_json))
+    claim = CLAIM_INFO_ADAPTER.validate_json(claim_json)
     llm_kwargs: dict = {"model": model_name, "temperature": temperature, "api_key": api_key}
     if _os.environ.get("OPENAI_BASE_URL"):
         llm_kwargs["base_url"] = _os.environ["OPENAI_BASE_URL"]
-    llm = ChatOpenAI(**llm_kwargs)
+    cache_key = (model_name, temperature, api_key, llm_kwargs.get("base_url"))
+    llm = _LLM_CACHE.get(cache_key)
+    if llm is None:
+        llm = _LLM_CACHE.setdefault(cache_key, ChatOpenAI(**llm_kwargs))
     chain = RECOMMENDATION_PROMPT | llm.with_structured_output(PolicyRecommendation)
     result: PolicyRecommendation = chain.invoke(
         {
@@ -297,7 +419,7 @@ def generate_recommendation(
             "market_cost_info": market_cost_info or "No market cost data.",
         }
     )
-    return _json.dumps(
+    return _orjson.dumps(
         {
             "policy_section": result.policy_section,
             "recommendation_summary": result.recommendation_summary,
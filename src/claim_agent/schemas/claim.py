@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from datetime import date
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
 
 class ClaimInfo(BaseModel):
@@ -23,6 +23,12 @@ class ClaimInfo(BaseModel):
     )
 
     model_config = {
+        # ignore/strip make LLM-produced JSON (extra keys, padded strings)
+        # validate on the first try; frozen skips the __setattr__ validation
+        # path and makes instances hashable for caching
+        "extra": "ignore",
+        "str_strip_whitespace": True,
+        "frozen": True,
         "json_schema_extra": {
             "examples": [
                 {
@@ -53,3 +59,11 @@ class ClaimDecision(BaseModel):
     notes: str | None = Field(
         default=None, description="Explanatory notes (rejection reason, coverage details, etc.)"
     )
+
+    model_config = {"extra": "ignore", "str_strip_whitespace": True, "frozen": True}
+
+
+# Prebuilt adapters for hot-path JSON parsing — validate_json goes straight
+# from the JSON string/bytes to the model with no intermediate dict
+CLAIM_INFO_ADAPTER: TypeAdapter[ClaimInfo] = TypeAdapter(ClaimInfo)
+CLAIM_DECISION_ADAPTER: TypeAdapter[ClaimDecision] = TypeAdapter(ClaimDecision)
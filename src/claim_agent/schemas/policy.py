@@ -15,6 +15,8 @@ class PolicyQueries(BaseModel):
         description="Targeted search queries to find relevant policy sections",
     )
 
+    model_config = {"extra": "ignore", "str_strip_whitespace": True, "frozen": True}
+
 
 class PolicyRecommendation(BaseModel):
     """LLM-generated coverage recommendation based on claim + policy text."""
@@ -29,3 +31,5 @@ class PolicyRecommendation(BaseModel):
     settlement_amount: float | None = Field(
         default=None, ge=0, description="Recommended settlement / payout amount in USD"
     )
+
+    model_config = {"extra": "ignore", "str_strip_whitespace": True, "frozen": True}
@@ -4,7 +4,6 @@ from __future__ import annotations
 
 import csv
 from datetime import date
-from pathlib import Path
 from typing import Any
 from unittest.mock import MagicMock
 
@@ -18,71 +17,91 @@ from claim_agent.schemas.claim import ClaimDecision, ClaimInfo
 # ---------------------------------------------------------------------------
 
 
-@pytest.fixture()
+# ClaimInfo is frozen, so these templates are safe to share — built (and
+# validated) once at import instead of on every test invocation
+_VALID_CLAIM = ClaimInfo(
+    claim_number="CLM-TEST-001",
+    policy_number="PN-2",
+    claimant_name="Jane Doe",
+    date_of_loss=date(2026, 2, 15),
+    loss_description="Rear-end collision at intersection, bumper and taillight damage",
+    estimated_repair_cost=3500.00,
+    vehicle_details="2022 Toyota Camry",
+)
+
+_INVALID_POLICY_CLAIM = ClaimInfo(
+    claim_number="CLM-TEST-002",
+    policy_number="PN-99",
+    claimant_name="John Nobody",
+    date_of_loss=date(2026, 3, 1),
+    loss_description="Fender bender in parking lot",
+    estimated_repair_cost=1200.00,
+)
+
+_EXPIRED_POLICY_CLAIM = ClaimInfo(
+    claim_number="CLM-TEST-003",
+    policy_number="PN-1",
+    claimant_name="Alice Expired",
+    date_of_loss=date(2026, 1, 10),
+    loss_description="Windshield cracked by road debris",
+    estimated_repair_cost=800.00,
+)
+
+_DUES_REMAINING_CLAIM = ClaimInfo(
+    claim_number="CLM-TEST-004",
+    policy_number="PN-3",
+    claimant_name="Bob Dues",
+    date_of_loss=date(2021, 8, 1),
+    loss_description="Hail damage to roof and hood",
+    estimated_repair_cost=5000.00,
+)
+
+_INFLATED_COST_CLAIM = ClaimInfo(
+    claim_number="CLM-TEST-005",
+    policy_number="PN-4",
+    claimant_name="Chuck Inflated",
+    date_of_loss=date(2026, 6, 1),
+    loss_description="Minor scratch on passenger door",
+    estimated_repair_cost=15000.00,
+    vehicle_details="2020 Honda Civic",
+)
+
+
+@pytest.fixture(scope="session")
 def valid_claim() -> ClaimInfo:
     """A valid claim that should pass all validation checks (PN-2: active, no dues)."""
-    return ClaimInfo(
-        claim_number="CLM-TEST-001",
-        policy_number="PN-2",
-        claimant_name="Jane Doe",
-        date_of_loss=date(2026, 2, 15),
-        loss_description="Rear-end collision at intersection, bumper and taillight damage",
-        estimated_repair_cost=3500.00,
-        vehicle_details="2022 Toyota Camry",
-    )
+    return _VALID_CLAIM
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
+def valid_claim_json(valid_claim: ClaimInfo) -> dict:
+    """The valid claim pre-dumped to a JSON-mode dict — model_dump walks the
+    model and coerces dates on every call, so dump once and share."""
+    return valid_claim.model_dump(mode="json")
+
+
+@pytest.fixture(scope="session")
 def invalid_policy_claim() -> ClaimInfo:
     """Claim with a policy number that does not exist in the CSV."""
-    return ClaimInfo(
-        claim_number="CLM-TEST-002",
-        policy_number="PN-99",
-        claimant_name="John Nobody",
-        date_of_loss=date(2026, 3, 1),
-        loss_description="Fender bender in parking lot",
-        estimated_repair_cost=1200.00,
-    )
+    return _INVALID_POLICY_CLAIM
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def expired_policy_claim() -> ClaimInfo:
     """Claim against PN-1 whose coverage ended 2022-12-31."""
-    return ClaimInfo(
-        claim_number="CLM-TEST-003",
-        policy_number="PN-1",
-        claimant_name="Alice Expired",
-        date_of_loss=date(2026, 1, 10),
-        loss_description="Windshield cracked by road debris",
-        estimated_repair_cost=800.00,
-    )
+    return _EXPIRED_POLICY_CLAIM
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def dues_remaining_claim() -> ClaimInfo:
     """Claim against PN-3 which has outstanding premium dues."""
-    return ClaimInfo(
-        claim_number="CLM-TEST-004",
-        policy_number="PN-3",
-        claimant_name="Bob Dues",
-        date_of_loss=date(2021, 8, 1),
-        loss_description="Hail damage to roof and hood",
-        estimated_repair_cost=5000.00,
-    )
+    return _DUES_REMAINING_CLAIM
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def inflated_cost_claim() -> ClaimInfo:
     """Claim with a suspiciously high estimated repair cost."""
-    return ClaimInfo(
-        claim_number="CLM-TEST-005",
-        policy_number="PN-4",
-        claimant_name="Chuck Inflated",
-        date_of_loss=date(2026, 6, 1),
-        loss_description="Minor scratch on passenger door",
-        estimated_repair_cost=15000.00,
-        vehicle_details="2020 Honda Civic",
-    )
+    return _INFLATED_COST_CLAIM
 
 
 # ---------------------------------------------------------------------------
@@ -90,20 +109,21 @@ def inflated_cost_claim() -> ClaimInfo:
 # ---------------------------------------------------------------------------
 
 
-@pytest.fixture()
-def coverage_csv(tmp_path: Path) -> str:
-    """Write a small coverage CSV and return its path."""
-    csv_file = tmp_path / "coverage_data.csv"
-    rows = [
-        ["policy_number", "premium_dues_remaining", "coverage_start_date", "coverage_end_date"],
-        ["PN-1", "False", "2022-01-01", "2022-12-31"],
-        ["PN-2", "False", "2023-01-01", "2027-01-01"],
-        ["PN-3", "True", "2021-06-01", "2022-06-01"],
-        ["PN-4", "False", "2023-05-01", "2026-12-31"],
-    ]
+_COVERAGE_ROWS = (
+    ("policy_number", "premium_dues_remaining", "coverage_start_date", "coverage_end_date"),
+    ("PN-1", "False", "2022-01-01", "2022-12-31"),
+    ("PN-2", "False", "2023-01-01", "2027-01-01"),
+    ("PN-3", "True", "2021-06-01", "2022-06-01"),
+    ("PN-4", "False", "2023-05-01", "2026-12-31"),
+)
+
+
+@pytest.fixture(scope="session")
+def coverage_csv(tmp_path_factory: pytest.TempPathFactory) -> str:
+    """Write a small coverage CSV once per session and return its path."""
+    csv_file = tmp_path_factory.mktemp("coverage") / "coverage_data.csv"
     with csv_file.open("w", newline="") as f:
-        writer = csv.writer(f)
-        writer.writerows(rows)
+        csv.writer(f).writerows(_COVERAGE_ROWS)
     return str(csv_file)
 
 
@@ -112,12 +132,13 @@ def coverage_csv(tmp_path: Path) -> str:
 # ---------------------------------------------------------------------------
 
 
-@pytest.fixture()
-def test_cfg(tmp_path: Path, coverage_csv: str) -> Any:
-    """Return a minimal OmegaConf DictConfig with test overrides."""
-    chroma_dir = str(tmp_path / "chroma_db")
+@pytest.fixture(scope="session")
+def _base_cfg_dict(tmp_path_factory: pytest.TempPathFactory, coverage_csv: str) -> dict:
+    """Build the raw test-config dict once per session."""
+    root = tmp_path_factory.mktemp("cfgroot")
+    chroma_dir = str(root / "chroma_db")
 
-    cfg_dict = {
+    return {
         "pipeline": {
             "type": "langchain",
             "graph": {"max_iterations": 10, "recursion_limit": 25},
@@ -139,7 +160,7 @@ def test_cfg(tmp_path: Path, coverage_csv: str) -> Any:
         },
         "data": {
             "coverage_csv": coverage_csv,
-            "policy_pdf": str(tmp_path / "policy.pdf"),
+            "policy_pdf": str(root / "policy.pdf"),
             "chroma_persist_dir": chroma_dir,
         },
         "logging": {
@@ -154,7 +175,19 @@ def test_cfg(tmp_path: Path, coverage_csv: str) -> Any:
             "cors_origins": ["http://localhost:8501"],
         },
     }
-    return OmegaConf.create(cfg_dict)
+
+
+@pytest.fixture(scope="session")
+def test_cfg(_base_cfg_dict: dict) -> Any:
+    """A session-wide DictConfig — OmegaConf node-graph construction is a
+    measurable per-test cost, so tests that only read share one instance."""
+    return OmegaConf.create(_base_cfg_dict)
+
+
+@pytest.fixture()
+def test_cfg_mut(_base_cfg_dict: dict) -> Any:
+    """Function-scoped DictConfig for tests that mutate the config."""
+    return OmegaConf.create(_base_cfg_dict)
 
 
 # ---------------------------------------------------------------------------
@@ -162,7 +195,7 @@ def test_cfg(tmp_path: Path, coverage_csv: str) -> Any:
 # ---------------------------------------------------------------------------
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def sample_decision() -> ClaimDecision:
     """A pre-built ClaimDecision for route tests."""
     return ClaimDecision(
@@ -179,9 +212,12 @@ def sample_decision() -> ClaimDecision:
 # ---------------------------------------------------------------------------
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def mock_pipeline(sample_decision: ClaimDecision) -> MagicMock:
-    """Return a MagicMock whose ``process_claim`` returns *sample_decision*."""
+    """Return a MagicMock whose ``process_claim`` returns *sample_decision*.
+
+    Session-scoped so the API app fixture can be too; test_api resets its
+    per-test state with an autouse fixture."""
     pipeline = MagicMock()
     pipeline.process_claim.return_value = sample_decision
     return pipeline
@@ -6,24 +6,34 @@ no LLM or vector-store calls are needed.
 
 from __future__ import annotations
 
+import asyncio
 from unittest.mock import MagicMock
 
+import orjson
 import pytest
 import pytest_asyncio
 from fastapi import FastAPI
 from httpx import ASGITransport, AsyncClient
 from omegaconf import DictConfig
 
-from claim_agent.schemas.claim import ClaimInfo
+from claim_agent.schemas.claim import ClaimDecision
+
+# All async tests share one session event loop so the session-scoped client
+# below can serve every test
+pytestmark = pytest.mark.asyncio(loop_scope="session")
 
 # ---------------------------------------------------------------------------
 # App fixture (bypass heavy lifespan)
 # ---------------------------------------------------------------------------
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def app(test_cfg: DictConfig, mock_pipeline: MagicMock) -> FastAPI:
-    """Build a FastAPI app with the pipeline mocked out."""
+    """Build a FastAPI app with the pipeline mocked out.
+
+    Session-scoped: router inclusion compiles routes and introspects the
+    Pydantic models, which is pure overhead to repeat per test.
+    """
     from claim_agent.api.routes.claims import router as claims_router
 
     _app = FastAPI(title="test")
@@ -33,32 +43,48 @@ def app(test_cfg: DictConfig, mock_pipeline: MagicMock) -> FastAPI:
     return _app
 
 
-@pytest_asyncio.fixture()
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
 async def client(app: FastAPI) -> AsyncClient:
     transport = ASGITransport(app=app)
     async with AsyncClient(transport=transport, base_url="http://test") as ac:
         yield ac
 
 
+@pytest.fixture(scope="session")
+def valid_payload_bytes(valid_claim_json: dict) -> bytes:
+    """The valid claim serialized once — posts reuse the same bytes buffer
+    instead of routing through stdlib json.dumps on every request."""
+    return orjson.dumps(valid_claim_json)
+
+
+@pytest.fixture(autouse=True)
+def _reset_mock_pipeline(mock_pipeline: MagicMock, sample_decision: ClaimDecision) -> None:
+    """Undo per-test mock tweaks (e.g. the 500-test's side_effect) so the
+    session-wide pipeline mock starts every test in its default state."""
+    mock_pipeline.reset_mock(return_value=True, side_effect=True)
+    mock_pipeline.process_claim.return_value = sample_decision
+
+
 # ═══════════════════════════════════════════════════════════════════════
 # Tests
 # ═══════════════════════════════════════════════════════════════════════
 
 
-class TestHealthEndpoint:
-    @pytest.mark.asyncio
-    async def test_health_returns_ok(self, client: AsyncClient) -> None:
-        resp = await client.get("/api/v1/health")
+class TestInfoEndpoints:
+    async def test_health_and_pipelines(self, client: AsyncClient) -> None:
+        """The two read-only info endpoints are independent — hit them
+        concurrently so the test pays one round of ASGI overhead."""
+        async with asyncio.TaskGroup() as tg:
+            health = tg.create_task(client.get("/api/v1/health"))
+            pipelines = tg.create_task(client.get("/api/v1/pipelines"))
+
+        resp = health.result()
         assert resp.status_code == 200
         body = resp.json()
         assert body["status"] == "healthy"
         assert "pipeline" in body
 
-
-class TestPipelinesEndpoint:
-    @pytest.mark.asyncio
-    async def test_list_pipelines(self, client: AsyncClient) -> None:
-        resp = await client.get("/api/v1/pipelines")
+        resp = pipelines.result()
         assert resp.status_code == 200
         body = resp.json()
         assert "langchain" in body["pipelines"]
@@ -66,19 +92,20 @@ class TestPipelinesEndpoint:
 
 
 class TestProcessClaim:
-    @pytest.mark.asyncio
     async def test_valid_claim_returns_decision(
-        self, client: AsyncClient, valid_claim: ClaimInfo
+        self, client: AsyncClient, valid_payload_bytes: bytes
     ) -> None:
-        payload = valid_claim.model_dump(mode="json")
-        resp = await client.post("/api/v1/claims/process", json=payload)
+        resp = await client.post(
+            "/api/v1/claims/process",
+            content=valid_payload_bytes,
+            headers={"content-type": "application/json"},
+        )
         assert resp.status_code == 200
         body = resp.json()
         assert body["claim_number"] == "CLM-TEST-001"
         assert body["covered"] is True
         assert body["deductible"] == 500.0
 
-    @pytest.mark.asyncio
     async def test_invalid_payload_returns_422(self, client: AsyncClient) -> None:
         """Missing required fields should trigger Pydantic validation error."""
         resp = await client.post(
@@ -87,16 +114,18 @@ class TestProcessClaim:
         )
         assert resp.status_code == 422
 
-    @pytest.mark.asyncio
     async def test_pipeline_error_returns_500(
         self,
         client: AsyncClient,
-        valid_claim: ClaimInfo,
+        valid_payload_bytes: bytes,
         mock_pipeline: MagicMock,
     ) -> None:
         """If the pipeline raises, the route should return a 500."""
         mock_pipeline.process_claim.side_effect = RuntimeError("boom")
-        payload = valid_claim.model_dump(mode="json")
-        resp = await client.post("/api/v1/claims/process", json=payload)
+        resp = await client.post(
+            "/api/v1/claims/process",
+            content=valid_payload_bytes,
+            headers={"content-type": "application/json"},
+        )
         assert resp.status_code == 500
         assert "boom" in resp.json()["detail"]
@@ -6,8 +6,10 @@ require no API keys or network access.
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock, patch
+from typing import Any
+from unittest.mock import MagicMock
 
+import pytest
 from omegaconf import DictConfig
 
 from claim_agent.pipelines.langchain_pipeline.chains import (
@@ -23,61 +25,84 @@ from claim_agent.pipelines.langchain_pipeline.chains import (
 from claim_agent.schemas.claim import ClaimDecision, ClaimInfo
 from claim_agent.schemas.policy import PolicyQueries, PolicyRecommendation
 
+# JSON-mode dumps keyed by claim number — the claim fixtures are frozen
+# session singletons, so each variant only ever needs dumping once
+_CLAIM_JSON_CACHE: dict[str, dict] = {}
+
+
+def _dump(claim: ClaimInfo) -> dict:
+    """Return the cached ``model_dump(mode="json")`` for *claim*."""
+    cached = _CLAIM_JSON_CACHE.get(claim.claim_number)
+    if cached is None:
+        cached = _CLAIM_JSON_CACHE.setdefault(claim.claim_number, claim.model_dump(mode="json"))
+    return cached
+
+
 # ═══════════════════════════════════════════════════════════════════════
 # Unit-level node tests
 # ═══════════════════════════════════════════════════════════════════════
 
 
+# (node under test, extra state keys, expected decision fields) — built once
+# at import so the three finalize tests share one parametrized body
+_FINALIZE_CASES = [
+    pytest.param(
+        node_finalize_invalid,
+        {"validation_reason": "Policy PN-99 not found"},
+        {"covered": False, "recommended_payout": 0.0},
+        "rejected",
+        id="invalid",
+    ),
+    pytest.param(
+        node_finalize_inflated,
+        {"market_cost_info": "Market estimate $1,200 vs claimed $15,000"},
+        {"covered": False},
+        "inflated",
+        id="inflated",
+    ),
+    pytest.param(
+        node_finalize_decision,
+        {
+            "recommendation": PolicyRecommendation(
+                policy_section="Section 4 — Collision",
+                recommendation_summary="Claim covered under collision.",
+                deductible=500.0,
+                settlement_amount=3000.0,
+            )
+        },
+        {"covered": True, "deductible": 500.0, "recommended_payout": 3000.0},
+        None,
+        id="decision",
+    ),
+]
+
+
 class TestNodeFunctions:
     """Test individual graph node functions."""
 
     def test_node_parse_claim(self, valid_claim: ClaimInfo) -> None:
-        state: ClaimState = {"claim_data": valid_claim.model_dump(mode="json")}
+        state: ClaimState = {"claim_data": _dump(valid_claim)}
         result = node_parse_claim(state)
         assert isinstance(result["claim"], ClaimInfo)
         assert result["claim"].claim_number == valid_claim.claim_number
         assert len(result["trace"]) == 1
 
-    def test_node_finalize_invalid(self, valid_claim: ClaimInfo) -> None:
-        state: ClaimState = {
-            "claim": valid_claim,
-            "validation_reason": "Policy PN-99 not found",
-            "trace": [],
-        }
-        result = node_finalize_invalid(state)
-        decision: ClaimDecision = result["decision"]
-        assert decision.covered is False
-        assert decision.recommended_payout == 0.0
-        assert "rejected" in (decision.notes or "").lower()
-
-    def test_node_finalize_inflated(self, valid_claim: ClaimInfo) -> None:
-        state: ClaimState = {
-            "claim": valid_claim,
-            "market_cost_info": "Market estimate $1,200 vs claimed $15,000",
-            "trace": [],
-        }
-        result = node_finalize_inflated(state)
+    @pytest.mark.parametrize(("node_fn", "state_extra", "expected", "note_word"), _FINALIZE_CASES)
+    def test_finalize_nodes(
+        self,
+        node_fn: Any,
+        state_extra: dict,
+        expected: dict,
+        note_word: str | None,
+        valid_claim: ClaimInfo,
+    ) -> None:
+        state: ClaimState = {"claim": valid_claim, "trace": [], **state_extra}
+        result = node_fn(state)
         decision: ClaimDecision = result["decision"]
-        assert decision.covered is False
-        assert "inflated" in (decision.notes or "").lower()
-
-    def test_node_finalize_decision(self, valid_claim: ClaimInfo) -> None:
-        rec = PolicyRecommendation(
-            policy_section="Section 4 — Collision",
-            recommendation_summary="Claim covered under collision.",
-            deductible=500.0,
-            settlement_amount=3000.0,
-        )
-        state: ClaimState = {
-            "claim": valid_claim,
-            "recommendation": rec,
-            "trace": [],
-        }
-        result = node_finalize_decision(state)
-        decision: ClaimDecision = result["decision"]
-        assert decision.covered is True
-        assert decision.deductible == 500.0
-        assert decision.recommended_payout == 3000.0
+        for field, value in expected.items():
+            assert getattr(decision, field) == value
+        if note_word is not None:
+            assert note_word in (decision.notes or "").lower()
 
 
 # ═══════════════════════════════════════════════════════════════════════
@@ -89,7 +114,8 @@ class TestRouters:
     """Test routing logic for conditional edges."""
 
     def test_route_valid(self) -> None:
-        assert route_after_validate({"is_valid": True}) == "check_policy"
+        # Valid claims fan out to both independent checks in parallel
+        assert route_after_validate({"is_valid": True}) == ["check_policy", "price_check"]
 
     def test_route_invalid(self) -> None:
         assert route_after_validate({"is_valid": False}) == "finalize_invalid"
@@ -106,39 +132,64 @@ class TestRouters:
 # ═══════════════════════════════════════════════════════════════════════
 
 
+@pytest.fixture(scope="session")
+def compiled_graph(test_cfg: DictConfig) -> Any:
+    """Compile the claim graph once for the whole session.
+
+    Safe to share: the nodes resolve the ``chains.*`` tool functions in the
+    module namespace at call time, so per-test monkeypatching still
+    intercepts them, and all per-claim state lives in the invocation dict.
+    """
+    return build_claim_graph(test_cfg, MagicMock())
+
+
+def _patch_chains(monkeypatch: pytest.MonkeyPatch, **mocks: Any) -> None:
+    """Install *mocks* into the chains module namespace.
+
+    Plain attribute assignment via monkeypatch — the nodes resolve these
+    names at call time, and this skips the per-test target-resolution work
+    stacked ``@patch`` decorators would repeat.
+    """
+    from claim_agent.pipelines.langchain_pipeline import chains as chains_mod
+
+    for name, mock in mocks.items():
+        monkeypatch.setattr(chains_mod, name, mock)
+
+
 class TestLangChainPipelineE2E:
     """End-to-end graph test with mocked external calls."""
 
-    @patch("claim_agent.pipelines.langchain_pipeline.chains.web_search_repair_cost")
-    @patch("claim_agent.pipelines.langchain_pipeline.chains.retrieve_policy_text_tool")
-    @patch("claim_agent.pipelines.langchain_pipeline.chains.generate_policy_queries")
-    @patch("claim_agent.pipelines.langchain_pipeline.chains.generate_recommendation")
     def test_valid_claim_approved(
         self,
-        mock_recommendation: MagicMock,
-        mock_queries: MagicMock,
-        mock_retrieve: MagicMock,
-        mock_price: MagicMock,
-        valid_claim: ClaimInfo,
-        test_cfg: DictConfig,
+        monkeypatch: pytest.MonkeyPatch,
+        valid_claim_json: dict,
+        compiled_graph: Any,
     ) -> None:
         """A valid claim should flow through to approval when nothing is inflated."""
         # Mock LLM-dependent tools
-        mock_queries.return_value = PolicyQueries(queries=["collision deductible"])
-        mock_retrieve.return_value = ["Section 4: Collision coverage..."]
-        mock_price.return_value = (3000.0, False, "Market estimate: $3,000")
-        mock_recommendation.return_value = PolicyRecommendation(
-            policy_section="Section 4",
-            recommendation_summary="Approved under collision coverage.",
-            deductible=500.0,
-            settlement_amount=3000.0,
+        _patch_chains(
+            monkeypatch,
+            generate_policy_queries=MagicMock(
+                return_value=PolicyQueries(queries=["collision deductible"])
+            ),
+            retrieve_policy_text_tool=MagicMock(
+                return_value=["Section 4: Collision coverage..."]
+            ),
+            web_search_repair_cost=MagicMock(
+                return_value=(3000.0, False, "Market estimate: $3,000")
+            ),
+            generate_recommendation=MagicMock(
+                return_value=PolicyRecommendation(
+                    policy_section="Section 4",
+                    recommendation_summary="Approved under collision coverage.",
+                    deductible=500.0,
+                    settlement_amount=3000.0,
+                )
+            ),
         )
 
-        mock_llm = MagicMock()
-        graph = build_claim_graph(test_cfg, mock_llm)
-
-        result = graph.invoke(
-            {"claim_data": valid_claim.model_dump(mode="json")},
+        result = compiled_graph.invoke(
+            {"claim_data": valid_claim_json},
             config={"recursion_limit": 25},
         )
 
@@ -147,21 +198,22 @@ class TestLangChainPipelineE2E:
         assert decision.deductible == 500.0
         assert decision.recommended_payout == 3000.0
 
-    @patch("claim_agent.pipelines.langchain_pipeline.chains.validate_claim_tool")
     def test_invalid_policy_rejected(
         self,
-        mock_validate: MagicMock,
+        monkeypatch: pytest.MonkeyPatch,
         invalid_policy_claim: ClaimInfo,
-        test_cfg: DictConfig,
+        compiled_graph: Any,
     ) -> None:
         """An invalid policy should be rejected at the validate step."""
-        mock_validate.return_value = (False, "Policy PN-99 not found in records")
-
-        mock_llm = MagicMock()
-        graph = build_claim_graph(test_cfg, mock_llm)
+        _patch_chains(
+            monkeypatch,
+            validate_claim_tool=MagicMock(
+                return_value=(False, "Policy PN-99 not found in records")
+            ),
+        )
 
-        result = graph.invoke(
-            {"claim_data": invalid_policy_claim.model_dump(mode="json")},
+        result = compiled_graph.invoke(
+            {"claim_data": _dump(invalid_policy_claim)},
             config={"recursion_limit": 25},
         )
 
@@ -169,27 +221,24 @@ class TestLangChainPipelineE2E:
         assert decision.covered is False
         assert "PN-99" in (decision.notes or "")
 
-    @patch("claim_agent.pipelines.langchain_pipeline.chains.web_search_repair_cost")
-    @patch("claim_agent.pipelines.langchain_pipeline.chains.retrieve_policy_text_tool")
-    @patch("claim_agent.pipelines.langchain_pipeline.chains.generate_policy_queries")
     def test_inflated_claim_rejected(
         self,
-        mock_queries: MagicMock,
-        mock_retrieve: MagicMock,
-        mock_price: MagicMock,
-        valid_claim: ClaimInfo,
-        test_cfg: DictConfig,
+        monkeypatch: pytest.MonkeyPatch,
+        valid_claim_json: dict,
+        compiled_graph: Any,
     ) -> None:
         """A claim flagged as inflated should be rejected at price_check."""
-        mock_queries.return_value = PolicyQueries(queries=["collision"])
-        mock_retrieve.return_value = ["Policy text"]
-        mock_price.return_value = (1000.0, True, "Market $1,000 vs claimed $3,500")
-
-        mock_llm = MagicMock()
-        graph = build_claim_graph(test_cfg, mock_llm)
+        _patch_chains(
+            monkeypatch,
+            generate_policy_queries=MagicMock(return_value=PolicyQueries(queries=["collision"])),
+            retrieve_policy_text_tool=MagicMock(return_value=["Policy text"]),
+            web_search_repair_cost=MagicMock(
+                return_value=(1000.0, True, "Market $1,000 vs claimed $3,500")
+            ),
+        )
 
-        result = graph.invoke(
-            {"claim_data": valid_claim.model_dump(mode="json")},
+        result = compiled_graph.invoke(
+            {"claim_data": valid_claim_json},
             config={"recursion_limit": 25},
         )
 
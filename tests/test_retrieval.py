@@ -5,14 +5,16 @@ Uses an in-memory/temporary ChromaDB collection with small test documents.
 
 from __future__ import annotations
 
+import hashlib
 from pathlib import Path
 
-import chromadb
 import pytest
-from sentence_transformers import SentenceTransformer
 
 from claim_agent.core.retrieval import retrieve_policy_text
 
+# chromadb and the embedding stack (torch, tokenizers) are imported inside
+# the fixtures/tests that need them, so deselected runs don't pay for them
+
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
@@ -29,22 +31,75 @@ _EMBEDDING_MODEL = "all-MiniLM-L6-v2"
 _COLLECTION_NAME = "test_policy_chunks"
 
 
-@pytest.fixture()
-def chroma_dir(tmp_path: Path) -> str:
-    """Create a small ChromaDB collection with sample docs and return the persist dir."""
-    persist_dir = str(tmp_path / "chroma_test")
-    client = chromadb.PersistentClient(path=persist_dir)
-    collection = client.get_or_create_collection(name=_COLLECTION_NAME)
+# Embeddings of the constant sample docs persist across pytest runs; warm
+# runs skip both the sentence_transformers import and the model load
+_EMB_CACHE_DIR = Path.home() / ".cache" / "claim_agent_tests"
+
+
+def _sample_embeddings():
+    """Embed the sample docs, reusing the on-disk cache when it matches.
+
+    Returns a numpy array — ``collection.add`` accepts it directly, so the
+    N×384 floats never round-trip through a Python list.
+    """
+    import numpy as np
+
+    key = hashlib.blake2b(
+        ("|".join(_SAMPLE_DOCS) + _EMBEDDING_MODEL).encode(), digest_size=16
+    ).hexdigest()
+    cache_file = _EMB_CACHE_DIR / f"{key}.npy"
+    if cache_file.exists():
+        return np.load(cache_file)
+
+    from sentence_transformers import SentenceTransformer
 
-    model = SentenceTransformer(_EMBEDDING_MODEL)
-    embeddings = model.encode(_SAMPLE_DOCS).tolist()
+    embeddings = SentenceTransformer(_EMBEDDING_MODEL).encode(
+        _SAMPLE_DOCS,
+        batch_size=len(_SAMPLE_DOCS),
+        convert_to_numpy=True,
+        show_progress_bar=False,
+    )
+    _EMB_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    np.save(cache_file, embeddings)
+    return embeddings
+
+
+@pytest.fixture(scope="session")
+def chroma_dir(tmp_path_factory: pytest.TempPathFactory):
+    """Create a small in-memory ChromaDB collection and return a persist dir.
+
+    Session-scoped: loading the MiniLM weights and embedding the sample docs
+    dominates this file's wall time, and the tests only read the collection.
+    The collection lives in an ``EphemeralClient`` (no SQLite/WAL on disk);
+    ``get_collection`` is patched to serve it for the test collection name
+    while unknown collections keep their real not-found behaviour. The
+    returned directory only satisfies the persist-dir existence check.
+    """
+    import chromadb
+
+    persist_dir = str(tmp_path_factory.mktemp("chroma_test"))
+    client = chromadb.EphemeralClient()
+    collection = client.get_or_create_collection(name=_COLLECTION_NAME)
 
     collection.add(
         ids=[f"doc-{i}" for i in range(len(_SAMPLE_DOCS))],
         documents=_SAMPLE_DOCS,
-        embeddings=embeddings,
+        embeddings=_sample_embeddings(),
     )
-    return persist_dir
+
+    from claim_agent.core import retrieval as _retrieval_mod
+
+    real_get_collection = _retrieval_mod.get_collection
+
+    def _patched(dir_: str, name: str):
+        if name == _COLLECTION_NAME:
+            return collection
+        return real_get_collection(dir_, name)
+
+    mp = pytest.MonkeyPatch()
+    mp.setattr(_retrieval_mod, "get_collection", _patched)
+    yield persist_dir
+    mp.undo()
 
 
 # ---------------------------------------------------------------------------
@@ -90,6 +145,8 @@ class TestRetrieval:
             )
 
     def test_missing_collection_raises(self, tmp_path: Path) -> None:
+        import chromadb
+
         # Create the directory but no collection
         persist_dir = str(tmp_path / "empty_chroma")
         Path(persist_dir).mkdir()
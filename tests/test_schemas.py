@@ -10,10 +10,35 @@ from pydantic import ValidationError
 from claim_agent.schemas.claim import ClaimDecision, ClaimInfo
 from claim_agent.schemas.policy import PolicyQueries, PolicyRecommendation
 
+# Round-trip sources serialized once — the fixtures they dump are frozen
+# session singletons, so every test sees identical JSON
+
+
+@pytest.fixture(scope="session")
+def valid_claim_json_str(valid_claim: ClaimInfo) -> str:
+    return valid_claim.model_dump_json()
+
+
+@pytest.fixture(scope="session")
+def sample_decision_json_str(sample_decision: ClaimDecision) -> str:
+    return sample_decision.model_dump_json()
+
+
 # ═══════════════════════════════════════════════════════════════════════
 # ClaimInfo
 # ═══════════════════════════════════════════════════════════════════════
 
+# Shared by the invalid-construction cases; each case overrides one field
+# (None means "omit the field entirely")
+_BASE_CLAIM_KWARGS = {
+    "claim_number": "CLM-X",
+    "policy_number": "PN-1",
+    "claimant_name": "Test",
+    "date_of_loss": date(2026, 1, 1),
+    "loss_description": "Scratch",
+    "estimated_repair_cost": 100.0,
+}
+
 
 class TestClaimInfo:
     """Test suite for :class:`ClaimInfo`."""
@@ -47,42 +72,25 @@ class TestClaimInfo:
         claim = ClaimInfo(**data)
         assert claim.date_of_loss == date(2026, 3, 15)
 
-    def test_repair_cost_must_be_positive(self) -> None:
-        with pytest.raises(ValidationError, match="greater_than"):
-            ClaimInfo(
-                claim_number="CLM-X",
-                policy_number="PN-1",
-                claimant_name="Test",
-                date_of_loss=date(2026, 1, 1),
-                loss_description="Scratch",
-                estimated_repair_cost=0,  # not > 0
-            )
-
-    def test_negative_repair_cost(self) -> None:
-        with pytest.raises(ValidationError):
-            ClaimInfo(
-                claim_number="CLM-X",
-                policy_number="PN-1",
-                claimant_name="Test",
-                date_of_loss=date(2026, 1, 1),
-                loss_description="Scratch",
-                estimated_repair_cost=-500,
-            )
-
-    def test_missing_required_field(self) -> None:
-        with pytest.raises(ValidationError):
-            ClaimInfo(
-                claim_number="CLM-X",
-                # policy_number missing
-                claimant_name="Test",
-                date_of_loss=date(2026, 1, 1),
-                loss_description="Scratch",
-                estimated_repair_cost=100.0,
-            )
+    @pytest.mark.parametrize(
+        ("overrides", "match"),
+        [
+            pytest.param({"estimated_repair_cost": 0}, "greater_than", id="zero-repair-cost"),
+            pytest.param(
+                {"estimated_repair_cost": -500}, "greater_than", id="negative-repair-cost"
+            ),
+            pytest.param({"policy_number": None}, "required", id="missing-policy-number"),
+        ],
+    )
+    def test_invalid_claim_rejected(self, overrides: dict, match: str) -> None:
+        kwargs = {
+            k: v for k, v in (_BASE_CLAIM_KWARGS | overrides).items() if v is not None
+        }
+        with pytest.raises(ValidationError, match=match):
+            ClaimInfo(**kwargs)
 
-    def test_json_round_trip(self, valid_claim: ClaimInfo) -> None:
-        json_str = valid_claim.model_dump_json()
-        restored = ClaimInfo.model_validate_json(json_str)
+    def test_json_round_trip(self, valid_claim: ClaimInfo, valid_claim_json_str: str) -> None:
+        restored = ClaimInfo.model_validate_json(valid_claim_json_str)
         assert restored == valid_claim
 
     def test_dict_round_trip(self, valid_claim: ClaimInfo) -> None:
@@ -126,9 +134,10 @@ class TestClaimDecision:
                 recommended_payout=-100,
             )
 
-    def test_json_round_trip(self, sample_decision: ClaimDecision) -> None:
-        json_str = sample_decision.model_dump_json()
-        restored = ClaimDecision.model_validate_json(json_str)
+    def test_json_round_trip(
+        self, sample_decision: ClaimDecision, sample_decision_json_str: str
+    ) -> None:
+        restored = ClaimDecision.model_validate_json(sample_decision_json_str)
         assert restored == sample_decision
 
 
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from datetime import date
 
-from claim_agent.core.validation import validate_claim
+from claim_agent.core.validation import validate_claim, validate_claims_batch
 from claim_agent.schemas.claim import ClaimInfo
 
 
@@ -87,3 +87,18 @@ class TestValidation:
         is_valid, reason = validate_claim(claim, coverage_csv)
         assert is_valid is False
         assert "outside" in reason.lower()
+
+    # ── Batch: results match the scalar path, in input order ────────────
+
+    def test_batch_matches_scalar(
+        self,
+        valid_claim: ClaimInfo,
+        invalid_policy_claim: ClaimInfo,
+        dues_remaining_claim: ClaimInfo,
+        coverage_csv: str,
+    ) -> None:
+        claims = [valid_claim, invalid_policy_claim, dues_remaining_claim]
+        results = validate_claims_batch(claims, coverage_csv)
+        assert results == [validate_claim(c, coverage_csv) for c in claims]
+        assert results[0][0] is True
+        assert results[1][0] is False